@@ -6,7 +6,7 @@ from ocean_utils.agreements.service_agreement_template import ServiceAgreementTe
 from ocean_utils.agreements.service_types import ServiceTypes, ServiceTypesIndices
 from ocean_utils.ddo.service import Service
 from ocean_utils.did import did_to_id
-from ocean_utils.utils.utilities import generate_prefixed_id
+from ocean_utils.utils.utilities import generate_prefixed_id, generate_prefixed_ids
 
 Agreement = namedtuple('Agreement', ('template', 'conditions'))
 
@@ -58,6 +58,9 @@ class ServiceAgreement(Service):
             _attributes['main']['creator'],
             _attributes[cls.AGREEMENT_TEMPLATE]
         )
+        # the template keeps a single copy shared with the identical templates, the attributes
+        # read it from the template, see `attributes`.
+        del _attributes[cls.AGREEMENT_TEMPLATE]
 
         return cls(
             _attributes,
@@ -83,17 +86,29 @@ class ServiceAgreement(Service):
 
         return cls.from_json(service_dict)
 
+    @property
+    def attributes(self):
+        """
+        Attributes dict, its agreement template is the dict of `service_agreement_template`.
+        A template shared with other services is copied first.
+
+        :return: dict
+        """
+        self._attributes[self.AGREEMENT_TEMPLATE] = self.service_agreement_template.template
+        return self._attributes
+
     def as_dictionary(self):
         values = Service.as_dictionary(self)
         values[ServiceAgreementTemplate.TEMPLATE_ID_KEY] = self.template_id
         attributes = values[ServiceAgreement.SERVICE_ATTRIBUTES]
-        attributes[ServiceAgreement.AGREEMENT_TEMPLATE] = self.service_agreement_template.template
+        attributes[ServiceAgreement.AGREEMENT_TEMPLATE] = \
+            self.service_agreement_template.get_template_json()
         return values
 
     def init_conditions_values(self, did, contract_name_to_address):
         param_map = {
             '_documentId': did_to_id(did),
-            '_amount': self.attributes['main']['price'],
+            '_amount': self.main['price'],
             '_rewardAddress': contract_name_to_address['EscrowReward']
         }
         conditions = self.conditions[:]
@@ -102,9 +117,10 @@ class ServiceAgreement(Service):
                 param.value = param_map.get(param.name, '')
 
             if cond.timeout > 0:
-                cond.timeout = self.attributes['main']['timeout']
+                cond.timeout = self.main['timeout']
 
         self.service_agreement_template.set_conditions(conditions)
+        self.invalidate()
 
     def get_price(self):
         """
@@ -220,6 +236,15 @@ class ServiceAgreement(Service):
         """
         return generate_prefixed_id()
 
+    @staticmethod
+    def create_new_agreement_ids(count):
+        """
+
+        :param count: int number of ids
+        :return: list of agreement ids, hex str
+        """
+        return generate_prefixed_ids(count)
+
     def generate_agreement_condition_ids(self, agreement_id, asset_id, consumer_address,
                                          publisher_address, keeper):
         """
@@ -4,6 +4,8 @@
 from eth_utils import add_0x_prefix, remove_0x_prefix
 from web3 import Web3
 
+from ocean_utils.utils.interning import intern_json, intern_string
+
 
 class Parameter:
     """
@@ -12,8 +14,8 @@ class Parameter:
     """
 
     def __init__(self, param_json):
-        self.name = param_json['name']
-        self.type = param_json['type']
+        self.name = intern_string(param_json['name'])
+        self.type = intern_string(param_json['type'])
         self.value = param_json['value']
         if self.type == 'bytes32':
             self.value = add_0x_prefix(self.value)
@@ -47,7 +49,7 @@ class Event:
     """
 
     def __init__(self, event_json):
-        self.values_dict = dict(event_json)
+        self.values_dict = intern_json(dict(event_json))
 
     @property
     def name(self):
@@ -96,11 +98,11 @@ class ServiceAgreementCondition(object):
 
         :param condition_json: dict
         """
-        self.name = condition_json['name']
+        self.name = intern_string(condition_json['name'])
         self.timelock = condition_json['timelock']
         self.timeout = condition_json['timeout']
-        self.contract_name = condition_json['contractName']
-        self.function_name = condition_json['functionName']
+        self.contract_name = intern_string(condition_json['contractName'])
+        self.function_name = intern_string(condition_json['functionName'])
         self.parameters = [Parameter(p) for p in condition_json['parameters']]
         self.events = [Event(e) for e in condition_json['events']]
 
@@ -1,8 +1,8 @@
 #  Copyright 2018 Ocean Protocol Foundation
 #  SPDX-License-Identifier: Apache-2.0
-import copy
-
 from ocean_utils.agreements.service_agreement_condition import Event, ServiceAgreementCondition
+from ocean_utils.ddo.frozen import thaw_value
+from ocean_utils.utils.structural_sharing import share_tree
 
 
 class ServiceAgreementTemplate(object):
@@ -13,9 +13,71 @@ class ServiceAgreementTemplate(object):
         self.template_id = template_id
         self.name = name
         self.creator = creator
-        self.template = {}
+        self._template = {}
+        # while not None the template is the read-only tree held by it, shared with the other
+        # templates of the same content, and it is copied into `_template` on first write.
+        self._shared_tree = None
         if template_json:
-            self.parse_template_json(copy.deepcopy(template_json))
+            template_json = template_json.get('template', template_json)
+            self._shared_tree = share_tree(template_json)
+            self._template = None
+
+    @property
+    def template(self):
+        """
+        Template dict, that can be changed. A shared template is copied first.
+
+        :return: dict
+        """
+        self._own_template()
+        return self._template
+
+    @template.setter
+    def template(self, template):
+        self._template = template
+        self._shared_tree = None
+
+    @property
+    def is_shared(self):
+        """True while the template is shared with the other templates of the same content."""
+        return self._shared_tree is not None
+
+    def get_template_json(self):
+        """
+        Return the template as a JSON dict to render it, a copy while it is shared and the
+        template dict otherwise.
+
+        :return: dict
+        """
+        if self._shared_tree is not None:
+            return thaw_value(self._shared_tree.value)
+        return self._template
+
+    def _own_template(self):
+        if self._shared_tree is not None:
+            self._template = thaw_value(self._shared_tree.value)
+            self._shared_tree = None
+
+    def _read_template(self):
+        """Template dict or read-only tree, the values read from it must not be returned."""
+        if self._shared_tree is not None:
+            return self._shared_tree.value
+        return self._template
+
+    def __getstate__(self):
+        # the shared tree can not be pickled, the template is shared again when loaded.
+        state = self.__dict__.copy()
+        state['_template'] = self.get_template_json()
+        state['_shared_tree'] = self._shared_tree is not None
+        return state
+
+    def __setstate__(self, state):
+        is_shared = state.pop('_shared_tree')
+        self.__dict__.update(state)
+        self._shared_tree = None
+        if is_shared:
+            self._shared_tree = share_tree(self._template)
+            self._template = None
 
     def parse_template_json(self, template_json):
         """
@@ -67,26 +129,28 @@ class ServiceAgreementTemplate(object):
 
         :return: string
         """
-        return self.template['contractName']
+        return self._read_template()['contractName']
 
     @property
     def agreement_events(self):
         """
-        List of agreements events.
+        List of agreements events, built from a copy of the template.
 
         :return: list of Event instances
         """
-        return [Event(e) for e in self.template['events']]
+        return [Event(thaw_value(e)) for e in self._read_template()['events']]
 
     @property
     def conditions(self):
         """
-        List of conditions.
+        List of conditions, built from a copy of the template. Change them with
+        `set_conditions`.
 
         :return: list of ServiceAgreementCondition instances
         """
         return [
-            ServiceAgreementCondition(cond_json) for cond_json in self.template['conditions']
+            ServiceAgreementCondition(thaw_value(cond_json))
+            for cond_json in self._read_template()['conditions']
         ]
 
     def set_conditions(self, conditions):
@@ -118,14 +182,15 @@ class ServiceAgreementTemplate(object):
 
         :return: dict
         """
+        template_json = self._read_template()
         template = {
             'name': self.name,
             'creator': self.creator,
             'serviceAgreementTemplate': {
                 'contractName': self.contract_name,
                 'events': [e.as_dictionary() for e in self.agreement_events],
-                'fulfillmentOrder': self.fulfillment_order,
-                'conditionDependency': self.condition_dependency,
+                'fulfillmentOrder': thaw_value(template_json['fulfillmentOrder']),
+                'conditionDependency': thaw_value(template_json['conditionDependency']),
                 'conditions': [cond.as_dictionary() for cond in self.conditions]
             }
         }
@@ -11,25 +11,34 @@ import logging
 
 from ocean_utils.aquarius.exceptions import AquariusGenericError
 from ocean_utils.ddo.ddo import DDO
+from ocean_utils.ddo.frozen import freeze_ddo
+from ocean_utils.ddo.patch import guard_patch, make_patch
 from ocean_utils.http_requests.requests_session import get_requests_session
+from ocean_utils.utils.single_flight import SingleFlight
 
 logger = logging.getLogger('aquarius')
 
+# status codes of a PATCH request meaning aquarius does not accept JSON patches, 404 is also
+# returned for unknown assets so it is not remembered.
+PATCH_NOT_SUPPORTED_STATUS_CODES = (404, 405, 415, 501)
+
 
 class Aquarius:
     """Aquarius wrapper to call different endpoint of aquarius component."""
 
-    def __init__(self, aquarius_url):
+    def __init__(self, aquarius_url, ddo_cache=None, known_dids=None):
         """
         The Metadata class is a wrapper on the Metadata Store, which has exposed a REST API.
 
         :param aquarius_url: Url of the aquarius instance.
+        :param ddo_cache: optional RefreshAheadCache instance used to cache the DDOs returned by
+            `get_asset_ddo`, entries are invalidated on update and retire. DDOs are cached and
+            returned as shared `FrozenDDO` snapshots, call `thaw()` to edit one.
+        :param known_dids: optional KnownDIDs instance, `get_asset_ddo` returns an empty result
+            without a request for DIDs that are certainly not in it. Published DIDs are added
+            to it, retired DIDs are kept until it is rebuilt since they may not have been added.
         """
-        assert aquarius_url, f'Invalid url "{aquarius_url}"'
-        # :HACK:
-        if '/api/v1/aquarius/assets' in aquarius_url:
-            aquarius_url = aquarius_url[:aquarius_url.find('/api/v1/aquarius/assets')]
-
+        aquarius_url = self.get_root_url(aquarius_url)
         self._base_url = f'{aquarius_url}/api/v1/aquarius/assets'
         self._headers = {'content-type': 'application/json'}
 
@@ -38,6 +47,24 @@ class Aquarius:
         logging.debug(f'Metadata assets at {self._base_url}')
 
         self.requests_session = get_requests_session()
+        self._ddo_cache = ddo_cache
+        self._known_dids = known_dids
+        self._single_flight = SingleFlight()
+        self._patch_supported = None
+
+    @staticmethod
+    def get_root_url(aquarius_url):
+        """
+        Return the root url of an aquarius instance, stripping the assets api path if present.
+
+        :param aquarius_url: Url of the aquarius instance.
+        :return: str
+        """
+        assert aquarius_url, f'Invalid url "{aquarius_url}"'
+        # :HACK:
+        if '/api/v1/aquarius/assets' in aquarius_url:
+            aquarius_url = aquarius_url[:aquarius_url.find('/api/v1/aquarius/assets')]
+        return aquarius_url
 
     @property
     def root_url(self):
@@ -84,21 +111,29 @@ class Aquarius:
         """
         Retrieve asset ddo for a given did.
 
+        Concurrent calls for the same did share a single request and get the same DDO instance,
+        When a `ddo_cache` is used the cached `FrozenDDO` snapshot is returned.
+
         :param did: Asset DID string
-        :return: DDO instance
+        :return: DDO instance, or FrozenDDO with a `ddo_cache`
         """
-        response = self.requests_session.get(f'{self.url}/{did}').content
-        if not response:
-            return {}
-        try:
-            parsed_response = json.loads(response)
-        except TypeError:
-            parsed_response = None
-        except ValueError:
-            raise ValueError(response.decode('UTF-8'))
-        if parsed_response is None:
+        if self._known_dids is not None and did not in self._known_dids:
+            logger.debug(f'Asset DID {did} is unknown, skipping request.')
             return {}
-        return DDO(dictionary=parsed_response)
+        if self._ddo_cache is not None:
+            return self._ddo_cache.get(did, self._get_frozen_asset_ddo, did)
+        return self._get_asset_ddo_once(did)
+
+    def _get_frozen_asset_ddo(self, did):
+        # the cache already coalesces its loads, and must not join a load started before an
+        # invalidation.
+        return freeze_ddo(self._get_asset_ddo(did))
+
+    def _get_asset_ddo_once(self, did):
+        return self._single_flight.do(did, self._get_asset_ddo, did)
+
+    def _get_asset_ddo(self, did):
+        return self._parse_ddo_response(self.requests_session.get(f'{self.url}/{did}').content)
 
     def get_asset_metadata(self, did):
         """
@@ -148,27 +183,73 @@ class Aquarius:
             raise Exception(f'{response.status_code} ERROR Full error: \n{response.text}')
         elif response.status_code == 201:
             response = json.loads(response.content)
+            if self._known_dids is not None:
+                self._known_dids.add(asset_did)
             logger.debug(f'Published asset DID {asset_did}')
             return response
         else:
             raise Exception(f'Unhandled ERROR: status-code {response.status_code}, '
                             f'error message {response.text}')
 
-    def update_asset_ddo(self, did, ddo):
+    def update_asset_ddo(self, did, ddo, previous_ddo=None):
         """
         Update the ddo of a did already registered.
 
+        When `previous_ddo` is given only the changes are sent, as a JSON patch, and the full
+        ddo is sent if aquarius does not support patches. The patch starts with `test`
+        operations on the id and on the type and index of the services it changes, so it is
+        rejected if the registered ddo is no longer `previous_ddo`. When `ddo` does not differ
+        from `previous_ddo` no request is made.
+
         :param did: Asset DID string
         :param ddo: DDO instance
-        :return: API response (depends on implementation)
+        :param previous_ddo: DDO instance currently registered for the did, optional.
+        :return: API response (depends on implementation), the dict of `ddo` if nothing
+            changed since `previous_ddo`.
         """
+        if previous_ddo is not None and self._patch_supported is not False:
+            source = previous_ddo.as_dictionary()
+            patch = make_patch(source, ddo.as_dictionary())
+            if not patch:
+                logger.debug(f'DDO of {did} is unchanged, skipping update.')
+                return ddo.as_dictionary()
+            response = self.patch_asset_ddo(did, guard_patch(source, patch))
+            if response is not None:
+                return response
+
         response = self.requests_session.put(f'{self.url}/{did}', data=ddo.as_text(),
                                              headers=self._headers)
+        self._invalidate_cached_ddo(did)
         if response.status_code == 200 or response.status_code == 201:
             return json.loads(response.content)
         else:
             raise Exception(f'Unable to update DDO: {response.content}')
 
+    def patch_asset_ddo(self, did, patch):
+        """
+        Update the ddo of a did already registered with a JSON patch, see `DDO.diff`.
+
+        :param did: Asset DID string
+        :param patch: list of JSON Patch operations
+        :return: API response (depends on implementation), None if aquarius does not
+            support patches.
+        """
+        response = self.requests_session.patch(
+            f'{self.url}/{did}', data=json.dumps(patch),
+            headers={'content-type': 'application/json-patch+json'}
+        )
+        self._invalidate_cached_ddo(did)
+        if response.status_code == 200 or response.status_code == 201:
+            self._patch_supported = True
+            return json.loads(response.content) if response.content else {}
+        elif response.status_code in PATCH_NOT_SUPPORTED_STATUS_CODES:
+            if response.status_code != 404:
+                self._patch_supported = False
+            logger.debug(f'Patch of {did} rejected with {response.status_code}.')
+            return None
+        else:
+            raise Exception(f'Unable to patch DDO: {response.content}')
+
     def text_search(self, text, sort=None, offset=100, page=1):
         """
         Search in aquarius using text query.
@@ -243,7 +324,10 @@ class Aquarius:
         :return: API response (depends on implementation)
         """
         response = self.requests_session.delete(f'{self.url}/{did}', headers=self._headers)
+        self._invalidate_cached_ddo(did)
         if response.status_code == 200:
+            # the DID is not discarded from `known_dids`, it may have been published by another
+            # client and never added, discarding it could hide other DIDs.
             logging.debug(f'Removed asset DID: {did} from metadata store')
             return response
 
@@ -255,7 +339,11 @@ class Aquarius:
         :return: str
         """
         response = self.requests_session.delete(f'{self.url}', headers=self._headers)
+        if self._ddo_cache is not None:
+            self._ddo_cache.clear()
         if response.status_code == 200:
+            if self._known_dids is not None:
+                self._known_dids.clear()
             logging.debug(f'Removed all the assets successfully')
             return response
 
@@ -279,6 +367,24 @@ class Aquarius:
             logger.info(self._parse_search_response(response.content))
             return False
 
+    def _invalidate_cached_ddo(self, did):
+        if self._ddo_cache is not None:
+            self._ddo_cache.invalidate(did)
+
+    @staticmethod
+    def _parse_ddo_response(response):
+        if not response:
+            return {}
+        try:
+            parsed_response = json.loads(response)
+        except TypeError:
+            parsed_response = None
+        except ValueError:
+            raise ValueError(response.decode('UTF-8'))
+        if parsed_response is None:
+            return {}
+        return DDO(dictionary=parsed_response)
+
     @staticmethod
     def _parse_search_response(response):
         if not response:
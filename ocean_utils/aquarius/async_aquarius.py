@@ -0,0 +1,63 @@
+"""
+Async Aquarius module.
+Help to communicate with the metadata store from an asyncio event loop.
+"""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import logging
+
+from ocean_utils.aquarius.aquarius import Aquarius
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+logger = logging.getLogger('aquarius')
+
+
+class AsyncAquarius:
+    """Asyncio counterpart of the Aquarius wrapper, requires aiohttp."""
+
+    def __init__(self, aquarius_url, session=None):
+        """
+
+        :param aquarius_url: Url of the aquarius instance.
+        :param session: aiohttp.ClientSession to use, a new one is created on first use if None.
+            A session passed in is not closed by `close`.
+        """
+        if session is None and aiohttp is None:
+            raise ImportError('aiohttp is required to use AsyncAquarius.')
+
+        self._base_url = f'{Aquarius.get_root_url(aquarius_url)}/api/v1/aquarius/assets'
+        self._session = session
+        self._owns_session = session is None
+
+    @property
+    def url(self):
+        """Base URL of the aquarius instance."""
+        return f'{self._base_url}/ddo'
+
+    def _get_session(self):
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def get_asset_ddo(self, did):
+        """
+        Retrieve asset ddo for a given did.
+
+        :param did: Asset DID string
+        :return: DDO instance
+        """
+        async with self._get_session().get(f'{self.url}/{did}') as response:
+            content = await response.read()
+        return Aquarius._parse_ddo_response(content)
+
+    async def close(self):
+        """Close the http session if it was created by this instance."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
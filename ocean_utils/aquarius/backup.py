@@ -0,0 +1,136 @@
+"""
+Aquarius backup module.
+Bulk backup of the DDOs of an Aquarius instance to an NDJSON file, and restore.
+"""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import argparse
+import logging
+import sys
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from ocean_utils.aquarius.aquarius import Aquarius
+from ocean_utils.ddo.ndjson import NDJSONWriter, read_ddos
+
+logger = logging.getLogger('aquarius')
+
+RestoreResult = namedtuple('RestoreResult', ('published', 'failed'))
+
+
+def _search_ddos(aquarius, page_size):
+    page = 1
+    while True:
+        response = aquarius.query_search({'query': {}}, sort={'created': 1}, offset=page_size,
+                                         page=page)
+        results = response.get('results', []) if isinstance(response, dict) else response
+        yield from results
+        total_pages = response.get('total_pages', page) if isinstance(response, dict) else 1
+        if not results or page >= total_pages:
+            return
+        page += 1
+
+
+def backup_aquarius(aquarius, path, use_search=False, page_size=100, workers=None):
+    """
+    Write all the DDOs of an aquarius instance to an NDJSON file.
+
+    :param aquarius: Aquarius instance
+    :param path: str or Path of the file, compressed according to its extension,
+        see `open_ndjson`.
+    :param use_search: bool read the DDOs page by page with `query_search` instead of a
+        single `list_assets_ddo` call, for catalogs too large for one response.
+    :param page_size: int number of DDOs per page when `use_search` is set.
+    :param workers: int number of processes serializing the DDOs.
+    :return: int number of DDOs written
+    """
+    ddos = _search_ddos(aquarius, page_size) if use_search else aquarius.list_assets_ddo()
+    with NDJSONWriter(path, workers) as writer:
+        writer.write_many(ddos)
+    logger.info(f'Backed up {writer.count} ddos to {path}.')
+    return writer.count
+
+
+def restore_aquarius(aquarius, path, workers=None, publish_workers=4):
+    """
+    Publish all the DDOs of an NDJSON file to an aquarius instance.
+
+    DDOs that fail to publish, for example because the DID is already registered, are
+    reported in the result and do not stop the restore.
+
+    :param aquarius: Aquarius instance
+    :param path: str or Path of the file, see `open_ndjson`.
+    :param workers: int number of processes parsing the file.
+    :param publish_workers: int number of concurrent publish requests.
+    :return: RestoreResult(published, failed), `failed` is a list of (did, error message).
+    """
+    published = 0
+    failed = []
+
+    def _collect(did, future):
+        nonlocal published
+        try:
+            future.result()
+            published += 1
+        except Exception as e:
+            logger.warning(f'Failed to restore {did}: {e}')
+            failed.append((did, str(e)))
+
+    with ThreadPoolExecutor(publish_workers) as executor:
+        pending = deque()
+        for ddo in read_ddos(path, workers):
+            pending.append((ddo.did, executor.submit(aquarius.publish_asset_ddo, ddo)))
+            if len(pending) > 2 * publish_workers:
+                _collect(*pending.popleft())
+        while pending:
+            _collect(*pending.popleft())
+
+    logger.info(f'Restored {published} ddos from {path}, {len(failed)} failed.')
+    return RestoreResult(published, failed)
+
+
+def main(argv=None):
+    """Command line entry point, run with --help for the usage."""
+    parser = argparse.ArgumentParser(
+        prog='ocean-aquarius-backup',
+        description='Backup the DDOs of an Aquarius instance to an NDJSON file, or restore them. '
+                    'Files ending in .gz or .zst are compressed.'
+    )
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    backup = commands.add_parser('backup', help='write all the DDOs to a file')
+    backup.add_argument('aquarius_url')
+    backup.add_argument('path')
+    backup.add_argument('--search', action='store_true',
+                        help='read the DDOs page by page using the search endpoint')
+    backup.add_argument('--page-size', type=int, default=100)
+    backup.add_argument('--workers', type=int, default=None,
+                        help='number of processes serializing the DDOs')
+
+    restore = commands.add_parser('restore', help='publish all the DDOs of a file')
+    restore.add_argument('aquarius_url')
+    restore.add_argument('path')
+    restore.add_argument('--workers', type=int, default=None,
+                         help='number of processes parsing the DDOs')
+    restore.add_argument('--publish-workers', type=int, default=4,
+                         help='number of concurrent publish requests')
+
+    args = parser.parse_args(argv)
+    aquarius = Aquarius(args.aquarius_url)
+    if args.command == 'backup':
+        count = backup_aquarius(aquarius, args.path, args.search, args.page_size, args.workers)
+        print(f'{count} ddos written to {args.path}')
+        return 0
+
+    result = restore_aquarius(aquarius, args.path, args.workers, args.publish_workers)
+    print(f'{result.published} ddos published, {len(result.failed)} failed')
+    for did, error in result.failed:
+        print(f'{did}: {error}', file=sys.stderr)
+    return 1 if result.failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""
+Catalog sync module.
+Keep a local mirror of the DDOs registered in Aquarius up to date incrementally.
+"""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import json
+import logging
+from collections import namedtuple
+
+from ocean_utils.data_store.storage_base import StorageBase
+from ocean_utils.ddo.ddo import DDO
+
+logger = logging.getLogger('aquarius')
+
+SyncResult = namedtuple('SyncResult', ('upserted', 'retired'))
+
+
+class CatalogMirrorStore(StorageBase):
+    """Sqlite store of the mirrored DDOs and of the sync checkpoints."""
+
+    def __init__(self, storage_path):
+        StorageBase.__init__(self, storage_path)
+        self._run_query(
+            '''CREATE TABLE IF NOT EXISTS ddos
+               (did VARCHAR PRIMARY KEY, created VARCHAR, updated VARCHAR, ddo TEXT);'''
+        )
+        self._run_query(
+            '''CREATE TABLE IF NOT EXISTS sync_checkpoints
+               (name VARCHAR PRIMARY KEY, value VARCHAR);'''
+        )
+
+    def upsert_ddos(self, ddo_dicts):
+        """
+        Insert or replace DDOs.
+
+        :param ddo_dicts: iterable of DDO dicts as returned by Aquarius.
+        :return: number of DDOs written.
+        """
+        rows = [
+            (d['id'], d.get('created'), d.get('updated'), json.dumps(d)) for d in ddo_dicts
+        ]
+        if not rows:
+            return 0
+        self._run_many(
+            'INSERT OR REPLACE INTO ddos (did, created, updated, ddo) VALUES (?,?,?,?)', rows
+        )
+        return len(rows)
+
+    def delete_ddos(self, dids):
+        """
+        Remove DDOs.
+
+        :param dids: iterable of DID strings.
+        :return: number of DDOs removed.
+        """
+        rows = [(did,) for did in dids]
+        if not rows:
+            return 0
+        return self._run_many('DELETE FROM ddos WHERE did=?', rows)
+
+    def get_ddo(self, did):
+        """
+        Get a mirrored DDO.
+
+        :param did: Asset DID string
+        :return: DDO instance or None
+        """
+        row = self._run_query('SELECT ddo FROM ddos WHERE did=?', (did,)).fetchone()
+        return DDO(json_text=row[0]) if row else None
+
+    def get_dids(self):
+        """Return the set of mirrored DIDs."""
+        return {row[0] for row in self._run_query('SELECT did FROM ddos')}
+
+    def count(self):
+        """Return the number of mirrored DDOs."""
+        return self._run_query('SELECT count(*) FROM ddos').fetchone()[0]
+
+    def get_checkpoint(self, name):
+        """Return the value of a checkpoint or None."""
+        row = self._run_query(
+            'SELECT value FROM sync_checkpoints WHERE name=?', (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_checkpoint(self, name, value):
+        """Save the value of a checkpoint."""
+        self._run_query(
+            'INSERT OR REPLACE INTO sync_checkpoints (name, value) VALUES (?,?)', (name, value))
+
+
+class CatalogSync:
+    """
+    Incremental sync of Aquarius into a `CatalogMirrorStore`.
+
+    Each timestamp field (`created` and `updated` by default) has its own checkpoint, the
+    highest value seen so far. A sync pages through `query_search` on each field from its
+    checkpoint on, in ascending order, and upserts the results. The boundary documents are
+    fetched again on the next sync which is harmless since upserts are idempotent.
+    Retirements do not show up in searches, when `reconcile` is True the list of DIDs
+    returned by `list_assets` is used to remove the retired DDOs from the mirror.
+    """
+    START = '1970-01-01T00:00:00Z'
+    END = '9999-12-31T23:59:59Z'
+
+    def __init__(self, aquarius, store, timestamp_fields=('created', 'updated'), page_size=100,
+                 reconcile=True):
+        """
+
+        :param aquarius: Aquarius instance
+        :param store: CatalogMirrorStore instance
+        :param timestamp_fields: tuple of DDO timestamp fields to sync on.
+        :param page_size: int number of DDOs requested per page.
+        :param reconcile: bool remove the DDOs no longer listed by aquarius.
+        """
+        self._aquarius = aquarius
+        self._store = store
+        self._timestamp_fields = timestamp_fields
+        self._page_size = page_size
+        self._reconcile = reconcile
+
+    def build_query(self, field, since):
+        """Return the search query of the DDOs with `field` at or after `since`."""
+        return {'query': {field: [since, self.END]}}
+
+    def sync(self):
+        """
+        Apply the changes made since the last sync to the mirror.
+
+        :return: SyncResult(upserted, retired) with the number of DDOs written and removed.
+        """
+        upserted = 0
+        for field in self._timestamp_fields:
+            upserted += self._sync_field(field)
+
+        retired = 0
+        if self._reconcile:
+            live_dids = set(self._aquarius.list_assets() or [])
+            retired = self._store.delete_ddos(self._store.get_dids() - live_dids)
+
+        logger.debug(f'Catalog sync done, {upserted} upserted, {retired} retired.')
+        return SyncResult(upserted, retired)
+
+    def _sync_field(self, field):
+        checkpoint = self._store.get_checkpoint(field) or self.START
+        latest = checkpoint
+        upserted = 0
+        page = 1
+        while True:
+            response = self._aquarius.query_search(
+                self.build_query(field, checkpoint), sort={field: 1}, offset=self._page_size,
+                page=page
+            )
+            results = response.get('results', []) if isinstance(response, dict) else response
+            if not results:
+                break
+
+            upserted += self._store.upsert_ddos(results)
+            latest = max([latest] + [d[field] for d in results if d.get(field)])
+            # save the progress so an interrupted sync resumes from the last page written.
+            self._store.set_checkpoint(field, latest)
+
+            total_pages = response.get('total_pages', page) if isinstance(response, dict) else 1
+            if page >= total_pages:
+                break
+            page += 1
+
+        return upserted
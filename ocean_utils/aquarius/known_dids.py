@@ -0,0 +1,91 @@
+"""Compact set of the DIDs known to a metadata store."""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import logging
+
+from ocean_utils.did import did_to_id_bytes
+from ocean_utils.utils.bloom_filter import CountingBloomFilter
+
+logger = logging.getLogger('aquarius')
+
+
+class KnownDIDs:
+    """
+    Probabilistic set of the DIDs registered in Aquarius.
+
+    Used to reject DIDs that certainly do not exist without a network call. DIDs are keyed
+    by their id bytes so a DID string and its 32 byte value match the same entry.
+
+    The set only knows about the DIDs it was built with and the ones published through an
+    Aquarius instance using it, it must be rebuilt periodically to pick up assets published
+    by other clients and to forget the retired ones.
+    """
+
+    def __init__(self, capacity=100000, error_rate=0.01):
+        """
+
+        :param capacity: int expected number of DIDs.
+        :param error_rate: float target rate of unknown DIDs reported as maybe existing.
+        """
+        self._filter = CountingBloomFilter(capacity, error_rate)
+
+    @classmethod
+    def from_aquarius(cls, aquarius, capacity=None, error_rate=0.01):
+        """
+        Build the set from all the assets listed by an aquarius instance.
+
+        :param aquarius: Aquarius instance
+        :param capacity: int expected number of DIDs, defaults to twice the listed assets.
+        :param error_rate: float target false positive rate.
+        :return: KnownDIDs instance
+        """
+        dids = aquarius.list_assets()
+        known_dids = cls(capacity or max(2 * len(dids), 1000), error_rate)
+        known_dids.update(dids)
+        logger.debug(f'Built known dids filter with {len(dids)} dids.')
+        return known_dids
+
+    @staticmethod
+    def _key(did):
+        try:
+            return did_to_id_bytes(did)
+        except (TypeError, ValueError):
+            return did
+
+    def add(self, did):
+        """Add a DID string or 32 byte value."""
+        self._filter.add(self._key(did))
+
+    def update(self, dids):
+        """Add DIDs."""
+        for did in dids:
+            self.add(did)
+
+    def discard(self, did):
+        """
+        Remove a DID that was previously added, see `CountingBloomFilter.discard`. Discarding
+        a DID that was never added can make other DIDs look unknown.
+        """
+        self._filter.discard(self._key(did))
+
+    def rebuild(self, dids):
+        """Replace the content of the set with `dids`."""
+        bloom_filter = CountingBloomFilter(self._filter.capacity, self._filter.error_rate)
+        for did in dids:
+            bloom_filter.add(self._key(did))
+        self._filter = bloom_filter
+
+    def clear(self):
+        """Remove all the DIDs."""
+        self._filter.clear()
+
+    def __contains__(self, did):
+        """False if the DID certainly does not exist, True if it may exist."""
+        if not isinstance(did, (str, bytes)):
+            return False
+        return self._key(did) in self._filter
+
+    def __len__(self):
+        return len(self._filter)
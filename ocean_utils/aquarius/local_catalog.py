@@ -0,0 +1,274 @@
+"""
+Local catalog module.
+In-process index over DDOs answering the searches supported by Aquarius.
+"""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import bisect
+import math
+import re
+
+from ocean_utils.agreements.service_types import ServiceTypes
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def _tokenize(text):
+    return set(_TOKEN_PATTERN.findall(text.lower())) if isinstance(text, str) else set()
+
+
+def _term(value):
+    return value.lower() if isinstance(value, str) else value
+
+
+class _SortedIndex:
+    """Sorted (value, position) pairs for range queries and sorting."""
+
+    def __init__(self):
+        self._keys = []
+        self._positions = []
+
+    def add(self, value, position):
+        i = bisect.bisect_right(self._keys, value)
+        self._keys.insert(i, value)
+        self._positions.insert(i, position)
+
+    def remove(self, value, position):
+        i = bisect.bisect_left(self._keys, value)
+        while self._positions[i] != position:
+            i += 1
+        del self._keys[i]
+        del self._positions[i]
+
+    def range(self, low, high):
+        start = 0 if low is None else bisect.bisect_left(self._keys, low)
+        end = len(self._keys) if high is None else bisect.bisect_right(self._keys, high)
+        return self._positions[start:end]
+
+
+class LocalCatalog:
+    """
+    In-memory searchable index of DDOs.
+
+    Answers the same queries as `Aquarius.query_search` and `Aquarius.text_search` and returns
+    results in the same format: a dict with the `results` (DDO dicts), `page`, `total_pages`
+    and `total_results` keys.
+
+    Supported query keys:
+      - `text`: list of strings, full-text search over the name and description. A string
+        matches when all its words are present.
+      - `type`, `license`, `author`, `name`, `tags`, `categories`: list of terms, case
+        insensitive exact match of any of them.
+      - `price`, `created`, `dateCreated`: [min, max] range, inclusive, either bound may be None.
+    """
+    TERM_FIELDS = ('type', 'license', 'author', 'name', 'tags', 'categories')
+    RANGE_FIELDS = ('price', 'created', 'dateCreated')
+
+    def __init__(self, ddos=None):
+        """
+
+        :param ddos: iterable of DDO instances to index.
+        """
+        self._documents = {}
+        self._did_to_position = {}
+        self._document_keys = {}
+        self._next_position = 0
+        self._terms = {field: {} for field in self.TERM_FIELDS}
+        self._tokens = {}
+        self._ranges = {field: _SortedIndex() for field in self.RANGE_FIELDS}
+        for ddo in ddos or []:
+            self.add(ddo)
+
+    def __len__(self):
+        return len(self._documents)
+
+    @staticmethod
+    def _extract(ddo_dict):
+        """Return the term values, the text tokens and the range values of a DDO dict."""
+        attributes = {}
+        for service in ddo_dict.get('service', []):
+            if service.get('type') == ServiceTypes.METADATA:
+                attributes = service.get('attributes') or {}
+                break
+        main = attributes.get('main') or {}
+        additional = attributes.get('additionalInformation') or {}
+
+        terms = {
+            'type': [main.get('type')],
+            'license': [main.get('license')],
+            'author': [main.get('author')],
+            'name': [main.get('name')],
+            'tags': additional.get('tags') or [],
+            'categories': additional.get('categories') or [],
+        }
+        tokens = _tokenize(main.get('name')) | _tokenize(additional.get('description'))
+        try:
+            price = float(main.get('price'))
+        except (TypeError, ValueError):
+            price = None
+        ranges = {
+            'price': price,
+            'created': ddo_dict.get('created'),
+            'dateCreated': main.get('dateCreated'),
+        }
+        return terms, tokens, ranges
+
+    def add(self, ddo):
+        """
+        Index a DDO, replacing the DDO with the same DID if any.
+
+        :param ddo: DDO instance
+        """
+        ddo_dict = ddo.as_dictionary()
+        self.remove(ddo_dict['id'])
+
+        position = self._next_position
+        self._next_position += 1
+        terms, tokens, ranges = self._extract(ddo_dict)
+        for field, values in terms.items():
+            index = self._terms[field]
+            for value in values:
+                if value is not None:
+                    index.setdefault(_term(value), set()).add(position)
+        for token in tokens:
+            self._tokens.setdefault(token, set()).add(position)
+        for field, value in ranges.items():
+            if value is not None:
+                self._ranges[field].add(value, position)
+
+        self._documents[position] = ddo_dict
+        self._did_to_position[ddo_dict['id']] = position
+        self._document_keys[position] = (terms, tokens, ranges)
+
+    def remove(self, did):
+        """
+        Remove the DDO of a DID from the index.
+
+        :param did: Asset DID string
+        :return: bool True if a DDO was removed.
+        """
+        position = self._did_to_position.pop(did, None)
+        if position is None:
+            return False
+
+        terms, tokens, ranges = self._document_keys.pop(position)
+        for field, values in terms.items():
+            for value in values:
+                if value is not None:
+                    self._discard(self._terms[field], _term(value), position)
+        for token in tokens:
+            self._discard(self._tokens, token, position)
+        for field, value in ranges.items():
+            if value is not None:
+                self._ranges[field].remove(value, position)
+        del self._documents[position]
+        return True
+
+    @staticmethod
+    def _discard(index, key, position):
+        positions = index.get(key)
+        if positions is not None:
+            positions.discard(position)
+            if not positions:
+                del index[key]
+
+    def _match_text(self, text):
+        matches = None
+        for token in _tokenize(text):
+            positions = self._tokens.get(token, set())
+            matches = positions if matches is None else matches & positions
+            if not matches:
+                return set()
+        return set(matches) if matches is not None else set()
+
+    def _match(self, field, values):
+        if field == 'text':
+            values = values if isinstance(values, list) else [values]
+            return set().union(*[self._match_text(text) for text in values])
+
+        if field in self._terms:
+            values = values if isinstance(values, list) else [values]
+            index = self._terms[field]
+            return set().union(*[index.get(_term(value), set()) for value in values])
+
+        if field in self._ranges:
+            assert isinstance(values, (list, tuple)) and len(values) == 2, \
+                f'Expecting a [min, max] range for {field}, got {values}'
+            low, high = values
+            if field == 'price':
+                low = None if low is None else float(low)
+                high = None if high is None else float(high)
+            return set(self._ranges[field].range(low, high))
+
+        raise ValueError(f'Unsupported search key {field}.')
+
+    def query_search(self, search_query, sort=None, offset=100, page=1):
+        """
+        Search using a query, see `Aquarius.query_search`.
+
+        Example: query_search({"query": {"price": [0, 10], "tags": ["weather"]}})
+
+        :param search_query: Python dictionary, with the search terms in the `query` key.
+        :param sort: dict with a single {field: 1/-1} entry, field being one of `price`,
+            `created` or `dateCreated`, or 1/-1 to sort by `created`.
+        :param offset: Integer with the number of elements displayed per page.
+        :param page: Integer with the number of page.
+        :return: dict with the results
+        """
+        assert page >= 1, f'Invalid page value {page}. Required page >= 1.'
+        query = search_query.get('query', search_query)
+        matches = None
+        for field, values in query.items():
+            if field in ('sort', 'offset', 'page'):
+                continue
+            positions = self._match(field, values)
+            matches = positions if matches is None else matches & positions
+        if matches is None:
+            matches = set(self._documents)
+
+        positions = self._sort(matches, sort)
+        total = len(positions)
+        start = (page - 1) * offset
+        return {
+            'results': [self._documents[p] for p in positions[start:start + offset]],
+            'page': page,
+            'total_pages': int(math.ceil(total / offset)) if offset else 0,
+            'total_results': total,
+        }
+
+    def text_search(self, text, sort=None, offset=100, page=1):
+        """
+        Full-text search over the name and description, see `Aquarius.text_search`.
+
+        :param text: String to be search.
+        :param sort: see `query_search`.
+        :param offset: Integer with the number of elements displayed per page.
+        :param page: Integer with the number of page.
+        :return: dict with the results
+        """
+        return self.query_search({'query': {'text': [text]}}, sort, offset, page)
+
+    def _sort(self, matches, sort):
+        if not sort:
+            return sorted(matches)
+
+        if isinstance(sort, dict):
+            (field, direction), = sort.items()
+        else:
+            field, direction = 'created', sort
+        if field not in self._ranges:
+            raise ValueError(f'Unsupported sort key {field}.')
+
+        with_value = []
+        without_value = []
+        for position in matches:
+            value = self._document_keys[position][2][field]
+            if value is None:
+                without_value.append(position)
+            else:
+                with_value.append((value, position))
+        with_value.sort(reverse=direction is not None and int(direction) < 0)
+        # documents without a value for the sort field come last, in insertion order.
+        return [position for _, position in with_value] + sorted(without_value)
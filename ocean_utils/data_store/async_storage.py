@@ -0,0 +1,77 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+
+class AsyncStorage:
+    """
+    Asyncio facade over a `StorageBase` instance.
+
+    All queries are executed on a single dedicated worker thread so the sqlite connection
+    is only ever used from one thread and the event loop is never blocked. The number of
+    queries waiting for the worker is bounded by `max_pending`, callers beyond that limit
+    wait (without blocking the loop) until a slot is free.
+    """
+
+    def __init__(self, storage, max_pending=64, loop=None):
+        """
+
+        :param storage: StorageBase instance to run the queries on. A connection the file
+            backed storage already opened on the calling thread is closed, the storage
+            connects again on the worker thread. The connection of a `:memory:` storage can
+            not be reopened without losing its content, it must be created with
+            `check_same_thread=False`.
+        :param max_pending: int max number of queries submitted to the worker at any time.
+        :param loop: asyncio event loop, defaults to the current event loop.
+        """
+        assert max_pending > 0, f'Invalid max_pending value {max_pending}, must be > 0.'
+        if storage._conn is not None and storage._check_same_thread:
+            if storage._storage_path == ':memory:':
+                raise ValueError('In memory storages must be created with '
+                                 'check_same_thread=False to be used from the AsyncStorage '
+                                 'worker thread.')
+            storage._conn.close()
+            storage._conn = None
+        self._storage = storage
+        self._max_pending = max_pending
+        self._loop = loop
+        self._slots = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    @property
+    def storage(self):
+        """The wrapped `StorageBase` instance."""
+        return self._storage
+
+    def _get_loop(self):
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+        return self._loop
+
+    def _get_slots(self):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_pending)
+        return self._slots
+
+    def _execute(self, query, args):
+        # Rows are fetched on the worker thread, the cursor must not leave it.
+        return self._storage._run_query(query, args).fetchall()
+
+    async def run_query(self, query, args=None):
+        """
+        Run a query on the storage worker thread.
+
+        :param query: str the sql query to execute in sqlite3.
+        :param args: tuple/list of arguments that go along with the query. Number of arguments
+            must match the number of positional `?` in the query string
+        :return: list of rows resulting from the query.
+        """
+        async with self._get_slots():
+            return await self._get_loop().run_in_executor(
+                self._executor, self._execute, query, args)
+
+    async def close(self):
+        """Disconnect the storage and stop the worker thread."""
+        await self._get_loop().run_in_executor(self._executor, self._storage._disconnect)
+        self._executor.shutdown(wait=True)
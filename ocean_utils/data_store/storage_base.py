@@ -8,15 +8,23 @@ class StorageBase:
     Provide basic database connection management (connect/close).
     """
 
-    def __init__(self, storage_path):
+    def __init__(self, storage_path, check_same_thread=True):
+        """
+
+        :param storage_path: str path of the sqlite database file, or `:memory:`
+        :param check_same_thread: bool passed to `sqlite3.connect`, False only when the
+            connection is handed over to another thread, see `AsyncStorage`.
+        """
         self._storage_path = storage_path
+        self._check_same_thread = check_same_thread
         self._conn = None
         if self._storage_path == ':memory:':
-            self._conn = sqlite3.connect(self._storage_path)
+            self._conn = sqlite3.connect(self._storage_path, check_same_thread=check_same_thread)
 
     def _connect(self):
         if self._storage_path != ':memory:':
-            self._conn = sqlite3.connect(self._storage_path)
+            self._conn = sqlite3.connect(
+                self._storage_path, check_same_thread=self._check_same_thread)
 
     def _disconnect(self):
         if self._storage_path != ':memory:':
@@ -38,3 +46,19 @@ class StorageBase:
         result = cursor.execute(query, args or ())
         self._conn.commit()
         return result
+
+    def _run_many(self, query, rows):
+        """
+        Execute the same query for each set of arguments in a single transaction.
+
+        :param query: str the sql query to execute in sqlite3.
+        :param rows: iterable of tuple/list of arguments, one per execution.
+        :return: number of rows modified.
+        """
+        if not self._conn:
+            self._connect()
+
+        cursor = self._conn.cursor()
+        cursor.executemany(query, rows)
+        self._conn.commit()
+        return cursor.rowcount
@@ -0,0 +1,278 @@
+"""
+    DDO archive
+    Append-only file of DDOs with a sorted DID index, read through mmap.
+
+    Layout, integers are little endian:
+      - header: 8 bytes magic `OCEANDDO`, uint32 format version, uint32 record encoding
+      - records: uint32 length followed by the DDO dict, as JSON or in the binary encoding
+      - index: one entry per DID sorted by key, 32 bytes sha256 of the DID followed by the
+        uint64 offset of its record
+      - trailer: uint64 offset of the index, uint64 number of entries, 8 bytes magic `DDOINDEX`
+
+    Appending writes the new records after the trailer, then a new index and trailer. The
+    previous index is left in place so the pages mapped by the readers stay valid, the index
+    of the last valid trailer is the one used. The trailer is written last once the records
+    and the index are on disk, so when an append is interrupted the archive opens with the
+    content it had before the append.
+"""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+
+from ocean_utils.ddo.binary import decode_ddo_dict, encode_ddo_dict
+from ocean_utils.ddo.ddo import DDO
+
+MAGIC = b'OCEANDDO'
+INDEX_MAGIC = b'DDOINDEX'
+VERSION = 1
+ENCODING_JSON = 0
+ENCODING_BINARY = 1
+
+_HEADER = struct.Struct('<8sII')
+_RECORD_LENGTH = struct.Struct('<I')
+_INDEX_ENTRY = struct.Struct('<32sQ')
+_TRAILER = struct.Struct('<QQ8s')
+_KEY_SIZE = 32
+
+logger = logging.getLogger(__name__)
+
+
+def _did_key(did):
+    return hashlib.sha256(did.encode('utf-8')).digest()
+
+
+def _encode(ddo_dict, encoding):
+    if encoding == ENCODING_BINARY:
+        return encode_ddo_dict(ddo_dict)
+    return json.dumps(ddo_dict, separators=(',', ':')).encode('utf-8')
+
+
+def _decode(data, encoding):
+    if encoding == ENCODING_BINARY:
+        return decode_ddo_dict(data)
+    return json.loads(bytes(data).decode('utf-8'))
+
+
+class DDOArchiveWriter:
+    """
+    Write DDOs to an archive file.
+
+    The index is written when the writer is closed, use it as a context manager. When a DID
+    is written more than once the last record wins.
+    """
+
+    def __init__(self, path, append=False, encoding=ENCODING_JSON):
+        """
+
+        :param path: str or Path of the archive file
+        :param append: bool add to an existing archive instead of overwriting it. Readers
+            opened before the writer is closed see the previous content.
+        :param encoding: ENCODING_JSON or ENCODING_BINARY (requires msgpack) for the records
+            of a new archive, appending keeps the encoding of the existing archive.
+        """
+        self._encoding = encoding
+        self._offsets = {}
+        if append and os.path.exists(path):
+            self._file = open(path, 'r+b')
+            with DDOArchive(path) as archive:
+                self._encoding = archive.encoding
+                self._offsets = dict(archive.index_entries())
+            # the file is never shortened, processes having it mapped would get SIGBUS when
+            # reading past the new end.
+            self._file.seek(0, os.SEEK_END)
+        else:
+            self._file = open(path, 'wb')
+            self._file.write(_HEADER.pack(MAGIC, VERSION, self._encoding))
+
+    @property
+    def count(self):
+        """Number of distinct DIDs in the archive."""
+        return len(self._offsets)
+
+    def write(self, ddo):
+        """
+        Append a DDO.
+
+        :param ddo: DDO instance or DDO dict
+        """
+        ddo_dict = ddo.as_dictionary() if isinstance(ddo, DDO) else ddo
+        data = _encode(ddo_dict, self._encoding)
+        self._offsets[_did_key(ddo_dict['id'])] = self._file.tell()
+        self._file.write(_RECORD_LENGTH.pack(len(data)))
+        self._file.write(data)
+
+    def write_many(self, ddos):
+        """Append DDOs, see `write`."""
+        for ddo in ddos:
+            self.write(ddo)
+
+    def close(self):
+        """Write the index and close the file."""
+        index_offset = self._file.tell()
+        for key in sorted(self._offsets):
+            self._file.write(_INDEX_ENTRY.pack(key, self._offsets[key]))
+        # the records and the index must be on disk before the trailer pointing at them.
+        self._sync()
+        self._file.write(_TRAILER.pack(index_offset, len(self._offsets), INDEX_MAGIC))
+        self._sync()
+        self._file.close()
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class DDOArchive:
+    """
+    Read-only access to an archive file.
+
+    The file is memory mapped, looking up a DID is a binary search over the index and only
+    touches the pages of the index entries visited and of the record. Processes opening the
+    same archive share its pages through the OS page cache.
+    """
+
+    def __init__(self, path):
+        """
+
+        :param path: str or Path of the archive file
+        """
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        size = len(self._mmap)
+        if size < _HEADER.size + _TRAILER.size:
+            raise ValueError(f'{path} is not a ddo archive, the file is too short.')
+        magic, version, self._encoding = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f'{path} is not a ddo archive.')
+        if version != VERSION:
+            raise ValueError(f'Unsupported ddo archive version {version}.')
+        trailer_offset = self._find_trailer(size)
+        if trailer_offset is None:
+            raise ValueError(f'{path} has no valid index, the archive was not closed properly.')
+        if trailer_offset != size - _TRAILER.size:
+            logger.warning(f'{path} ends with an incomplete append, reading the content it '
+                           f'had before that append.')
+        self._index_offset, self._count, _ = _TRAILER.unpack_from(self._mmap, trailer_offset)
+
+    def _find_trailer(self, end):
+        """
+        Return the offset of the last valid trailer before `end`, or None. A trailer is valid
+        when its index ends right where it starts.
+        """
+        while True:
+            position = self._mmap.rfind(INDEX_MAGIC, _HEADER.size, end)
+            if position < 0:
+                return None
+            trailer_offset = position + len(INDEX_MAGIC) - _TRAILER.size
+            if trailer_offset >= _HEADER.size:
+                index_offset, count, _ = _TRAILER.unpack_from(self._mmap, trailer_offset)
+                if _HEADER.size <= index_offset and \
+                        index_offset + count * _INDEX_ENTRY.size == trailer_offset:
+                    return trailer_offset
+            end = position + len(INDEX_MAGIC) - 1
+
+    @property
+    def encoding(self):
+        return self._encoding
+
+    @property
+    def index_offset(self):
+        return self._index_offset
+
+    def __len__(self):
+        return self._count
+
+    def _entry(self, i):
+        return _INDEX_ENTRY.unpack_from(self._mmap, self._index_offset + i * _INDEX_ENTRY.size)
+
+    def _find(self, did):
+        key = _did_key(did)
+        data = self._mmap
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            position = self._index_offset + middle * _INDEX_ENTRY.size
+            if data[position:position + _KEY_SIZE] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count:
+            entry_key, offset = self._entry(low)
+            if entry_key == key:
+                return offset
+        return None
+
+    def _read_record(self, offset):
+        length, = _RECORD_LENGTH.unpack_from(self._mmap, offset)
+        start = offset + _RECORD_LENGTH.size
+        return _decode(self._mmap[start:start + length], self._encoding)
+
+    def index_entries(self):
+        """Generator of the (key, offset) entries of the index, sorted by key."""
+        for i in range(self._count):
+            yield self._entry(i)
+
+    def __contains__(self, did):
+        return isinstance(did, str) and self._find(did) is not None
+
+    def get_ddo_dict(self, did):
+        """
+        Read the DDO dict of a DID.
+
+        :param did: Asset DID string
+        :return: DDO dict or None if the DID is not in the archive.
+        """
+        offset = self._find(did)
+        return None if offset is None else self._read_record(offset)
+
+    def get_ddo(self, did):
+        """
+        Read the DDO of a DID.
+
+        :param did: Asset DID string
+        :return: DDO instance or None if the DID is not in the archive.
+        """
+        ddo_dict = self.get_ddo_dict(did)
+        return None if ddo_dict is None else DDO(dictionary=ddo_dict)
+
+    def __iter__(self):
+        """Iterate over the DDOs in the order they were written, skipping overwritten records."""
+        for offset in sorted(offset for _, offset in self.index_entries()):
+            yield DDO(dictionary=self._read_record(offset))
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def write_archive(path, ddos, encoding=ENCODING_JSON):
+    """
+    Write DDOs to a new archive file.
+
+    :param path: str or Path of the archive file
+    :param ddos: iterable of DDO instances or DDO dicts
+    :param encoding: ENCODING_JSON or ENCODING_BINARY, see `DDOArchiveWriter`.
+    :return: int number of DIDs in the archive
+    """
+    with DDOArchiveWriter(path, encoding=encoding) as writer:
+        writer.write_many(ddos)
+    return writer.count
@@ -0,0 +1,74 @@
+"""
+    Binary encoding of DDO dicts
+    MessagePack based, with the well-known DDO keys replaced by small integers.
+"""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+FORMAT_VERSION = 1
+
+# Keys encoded as their position in this tuple. JSON object keys are always strings so the
+# integer codes can not be confused with other keys. The codes are part of the format, only
+# append new keys at the end.
+WELL_KNOWN_KEYS = (
+    '@context', 'id', 'created', 'updated', 'publicKey', 'authentication', 'service', 'proof',
+    'type', 'owner', 'publicKeyPem', 'publicKeyBase58', 'publicKeyHex', 'index',
+    'serviceEndpoint', 'templateId', 'attributes', 'main', 'name', 'dateCreated', 'author',
+    'license', 'price', 'files', 'url', 'checksum', 'checksumType', 'contentLength',
+    'contentType', 'encoding', 'compression', 'resourceId', 'encryptedFiles',
+    'additionalInformation', 'description', 'tags', 'categories', 'copyrightHolder',
+    'workExample', 'links', 'inLanguage', 'curation', 'rating', 'numVotes', 'isListed',
+    'serviceAgreementTemplate', 'contractName', 'events', 'fulfillmentOrder', 'conditions',
+    'parameters', 'value', 'timeout', 'timelock', 'dependencies', 'handler', 'functionName',
+    'version', 'eventName', 'actorType', 'creator', 'signatureValue', 'datePublished',
+    'cost', 'consumer', 'provider', 'publisher', 'did',
+)
+_KEY_CODES = {key: code for code, key in enumerate(WELL_KNOWN_KEYS)}
+
+
+def _check_msgpack():
+    if msgpack is None:
+        raise ImportError('msgpack is required for the binary encoding of DDOs.')
+
+
+def _intern_keys(value):
+    if isinstance(value, dict):
+        return {_KEY_CODES.get(k, k): _intern_keys(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_intern_keys(v) for v in value]
+    return value
+
+
+def _restore_keys(pairs):
+    return {WELL_KNOWN_KEYS[k] if isinstance(k, int) else k: v for k, v in pairs}
+
+
+def encode_ddo_dict(ddo_dict):
+    """
+    Encode a DDO dict, requires msgpack.
+
+    :param ddo_dict: dict as returned by `DDO.as_dictionary`
+    :return: bytes
+    """
+    _check_msgpack()
+    return bytes((FORMAT_VERSION,)) + msgpack.packb(_intern_keys(ddo_dict), use_bin_type=True)
+
+
+def decode_ddo_dict(data):
+    """
+    Decode bytes returned by `encode_ddo_dict`, requires msgpack.
+
+    :param data: bytes-like object
+    :return: DDO dict
+    """
+    _check_msgpack()
+    if not data or data[0] != FORMAT_VERSION:
+        raise ValueError('Invalid binary DDO, unknown format version.')
+    return msgpack.unpackb(memoryview(data)[1:], raw=False, strict_map_key=False,
+                           object_pairs_hook=_restore_keys)
@@ -0,0 +1,95 @@
+"""
+    Bulk parsing of DDOs
+    Parse and validate many DDOs on a process pool.
+"""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from ocean_utils.ddo.ddo import DDO
+from ocean_utils.ddo.metadata import Metadata
+
+ParsedDDO = namedtuple('ParsedDDO', ('ddo', 'valid', 'error'))
+
+MIN_CHUNK_SIZE = 16
+MAX_CHUNK_SIZE = 512
+
+
+def parse_ddo(item, validate=True):
+    """
+    Parse and validate one DDO.
+
+    :param item: DDO JSON text as str or bytes, or DDO dict
+    :param validate: bool check the metadata with `Metadata.validate`
+    :return: ParsedDDO(ddo, valid, error), `ddo` is None and `error` the error message if
+        the item could not be parsed. `valid` is None when `validate` is False.
+    """
+    try:
+        if isinstance(item, (str, bytes, bytearray)):
+            ddo = DDO(json_text=item)
+        else:
+            ddo = DDO(dictionary=item)
+    except Exception as e:
+        return ParsedDDO(None, False, f'{type(e).__name__}: {e}')
+
+    valid = None
+    if validate:
+        metadata = ddo.metadata
+        valid = bool(metadata) and Metadata.validate(metadata)
+    return ParsedDDO(ddo, valid, None)
+
+
+def _parse_chunk(items, validate):
+    return [parse_ddo(item, validate) for item in items]
+
+
+def _chunk_size(items, workers):
+    """Chunks big enough to amortize the IPC cost, and at least 4 per worker to balance the load."""
+    try:
+        count = len(items)
+    except TypeError:
+        return MAX_CHUNK_SIZE // 2
+    return max(MIN_CHUNK_SIZE, min(MAX_CHUNK_SIZE, count // (4 * workers) or 1))
+
+
+def parse_ddos(items, workers=None, chunk_size=None, validate=True):
+    """
+    Parse and validate DDOs on a process pool, see `parse_ddo`.
+
+    The items are sent to the workers in chunks, a bounded number of chunks is in flight so
+    the items can be a generator over a large dump.
+
+    :param items: iterable of DDO JSON texts (str or bytes) or DDO dicts
+    :param workers: int number of processes, defaults to the number of CPUs, 0 parses in
+        the calling process.
+    :param chunk_size: int number of items per chunk, by default derived from the number of
+        items and workers.
+    :param validate: bool check the metadata with `Metadata.validate`
+    :return: generator of ParsedDDO, in the order of the items
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not workers:
+        for item in items:
+            yield parse_ddo(item, validate)
+        return
+
+    chunk_size = chunk_size or _chunk_size(items, workers)
+    iterator = iter(items)
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            pending.append(executor.submit(_parse_chunk, chunk, validate))
+            if len(pending) > 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,140 @@
+"""
+    Columnar export of DDOs
+    Turn a stream of DDOs into array backed columns for analytics.
+"""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+MAIN_TEXT_FIELDS = ('name', 'type', 'author', 'license')
+TIMEOUT_MISSING = -1
+
+
+def _to_datetime64(timestamp):
+    if not timestamp:
+        return numpy.datetime64('NaT')
+    try:
+        return numpy.datetime64(timestamp.rstrip('Z'), 's')
+    except (ValueError, AttributeError):
+        return numpy.datetime64('NaT')
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return numpy.nan
+
+
+def ddos_to_columns(ddos):
+    """
+    Build a columnar table from DDOs, requires numpy.
+
+    Columns:
+      - `did`, `publisher`, `name`, `type`, `author`, `license`: object arrays of str/None
+      - `created`, `dateCreated`: datetime64[s] arrays, NaT when missing
+      - `price`: float64 array, nan when missing
+      - `file_count`: int64 array
+      - `service_types`: object array of tuples of service types
+      - `<service type>.<condition name>.timeout`: int64 array of the condition timeout,
+        -1 when the DDO has no such condition
+
+    :param ddos: iterable of DDO instances
+    :return: dict of column name to numpy array, all the arrays have the same length
+    """
+    if numpy is None:
+        raise ImportError('numpy is required to build the columns.')
+
+    rows = {name: [] for name in ('did', 'publisher', 'created', 'dateCreated', 'price',
+                                  'file_count', 'service_types') + MAIN_TEXT_FIELDS}
+    timeouts = {}
+    count = 0
+    for ddo in ddos:
+        metadata = ddo.metadata or {}
+        main = metadata.get('main') or {}
+        rows['did'].append(ddo.did)
+        rows['publisher'].append(ddo.publisher)
+        rows['created'].append(_to_datetime64(ddo.created))
+        rows['dateCreated'].append(_to_datetime64(main.get('dateCreated')))
+        rows['price'].append(_to_float(main.get('price')))
+        rows['file_count'].append(len(main.get('files') or ()))
+        for field in MAIN_TEXT_FIELDS:
+            rows[field].append(main.get(field))
+
+        service_types = []
+        for service in ddo.services_view:
+            service_types.append(service.type)
+            template = getattr(service, 'service_agreement_template', None)
+            if template is None:
+                continue
+            for condition in template.conditions:
+                column = timeouts.setdefault(f'{service.type}.{condition.name}.timeout', {})
+                column[count] = condition.timeout
+        rows['service_types'].append(tuple(service_types))
+        count += 1
+
+    columns = {
+        'did': _object_array(rows['did']),
+        'publisher': _object_array(rows['publisher']),
+        'created': numpy.array(rows['created'], dtype='datetime64[s]'),
+        'dateCreated': numpy.array(rows['dateCreated'], dtype='datetime64[s]'),
+        'price': numpy.array(rows['price'], dtype=numpy.float64),
+        'file_count': numpy.array(rows['file_count'], dtype=numpy.int64),
+        'service_types': _object_array(rows['service_types']),
+    }
+    for field in MAIN_TEXT_FIELDS:
+        columns[field] = _object_array(rows[field])
+    for name, values in sorted(timeouts.items()):
+        column = numpy.full(count, TIMEOUT_MISSING, dtype=numpy.int64)
+        column[list(values.keys())] = list(values.values())
+        columns[name] = column
+
+    return columns
+
+
+def _object_array(values):
+    array = numpy.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def columns_to_arrow(columns):
+    """
+    Convert the columns returned by `ddos_to_columns` to a pyarrow Table, requires pyarrow.
+
+    :param columns: dict of column name to numpy array
+    :return: pyarrow.Table
+    """
+    if pyarrow is None:
+        raise ImportError('pyarrow is required to convert the columns to an arrow table.')
+
+    arrays = {}
+    for name, values in columns.items():
+        if values.dtype == object:
+            values = [list(v) if isinstance(v, tuple) else v for v in values]
+        arrays[name] = pyarrow.array(values)
+    return pyarrow.Table.from_arrays(list(arrays.values()), names=list(arrays.keys()))
+
+
+def write_parquet(columns, path):
+    """
+    Write the columns returned by `ddos_to_columns` to a parquet file, requires pyarrow.
+
+    :param columns: dict of column name to numpy array
+    :param path: str path of the parquet file
+    """
+    if pyarrow is None:
+        raise ImportError('pyarrow is required to write a parquet file.')
+
+    pyarrow.parquet.write_table(columns_to_arrow(columns), path)
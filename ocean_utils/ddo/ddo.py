@@ -5,31 +5,70 @@
 import copy
 import json
 import logging
-
-from eth_utils import add_0x_prefix
+from collections.abc import Sequence
 
 from ocean_utils.agreements.service_agreement import ServiceAgreement
 from ocean_utils.agreements.service_types import ServiceTypes
 from ocean_utils.ddo.public_key_base import PublicKeyBase
 from ocean_utils.ddo.public_key_rsa import PUBLIC_KEY_TYPE_ETHEREUM_ECDSA
-from ocean_utils.did import did_to_id, OCEAN_PREFIX
+from ocean_utils.did import OCEAN_PREFIX, ParsedDID
+from ocean_utils.utils.interning import intern_json, is_interning_enabled
 from ocean_utils.utils.utilities import get_timestamp
+from .binary import decode_ddo_dict, encode_ddo_dict
 from .constants import DID_DDO_CONTEXT_URL, PROOF_TYPE
+from .frozen import FrozenDDO
+from .patch import apply_patch, make_patch
 from .public_key_rsa import PUBLIC_KEY_TYPE_RSA, PublicKeyRSA
 from .service import Service
 
 logger = logging.getLogger('ddo')
 
 
+class _SequenceView(Sequence):
+    """Read-only view over a list, the list is not copied."""
+    __slots__ = ('_items',)
+
+    def __init__(self, items):
+        self._items = items
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._items!r})'
+
+
+def _copy_service_dict(service_dict):
+    attributes = dict(service_dict['attributes'])
+    if ServiceAgreement.AGREEMENT_TEMPLATE in attributes:
+        # rendered from a copy of the template while it is shared with other services.
+        attributes[ServiceAgreement.AGREEMENT_TEMPLATE] = copy.deepcopy(
+            attributes[ServiceAgreement.AGREEMENT_TEMPLATE])
+    return dict(service_dict, attributes=attributes)
+
+
 class DDO:
     """DDO class to create, import, export, validate DDO objects."""
 
     def __init__(self, did=None, json_text=None, json_filename=None, created=None, dictionary=None):
         """Clear the DDO data values."""
-        self._did = did
+        # rendered dict and text by is_proof, reused until the DDO changes, see `invalidate`.
+        self._rendered = {}
+        self._did = None
+        self._parsed_did = None
+        self._asset_id = None
+        self._set_did(did)
         self._public_keys = []
         self._authentications = []
         self._services = []
+        self._services_by_type = {}
+        self._services_by_index = {}
         self._proof = None
         self._created = None
         self._other_values = {}
@@ -44,7 +83,7 @@ class DDO:
                 json_text = file_handle.read()
 
         if json_text:
-            self._read_dict(json.loads(json_text))
+            self._read_dict(json.loads(json_text), copy_values=False)
         elif dictionary:
             self._read_dict(dictionary)
 
@@ -58,13 +97,37 @@ class DDO:
         """The asset id part of the DID"""
         if not self._did:
             return None
-        return add_0x_prefix(did_to_id(self._did))
+        self._get_parsed_did()
+        return self._asset_id
+
+    @property
+    def asset_id_bytes(self):
+        """The asset id part of the DID in bytes"""
+        if not self._did:
+            return None
+        return self._get_parsed_did().id_bytes
+
+    def _set_did(self, did):
+        """Set the DID, its parts are parsed on first access."""
+        self._did = did
+
+    def _get_parsed_did(self):
+        """Return the cached parts of the DID, parsing it again only if the DID has changed."""
+        if self._parsed_did is None or self._parsed_did.did != self._did:
+            self._parsed_did = ParsedDID.from_did(self._did)
+            self._asset_id = self._parsed_did.asset_id
+        return self._parsed_did
 
     @property
     def services(self):
         """Get the list of services."""
         return self._services[:]
 
+    @property
+    def services_view(self):
+        """Get a read-only view of the services, the list is not copied."""
+        return _SequenceView(self._services)
+
     @property
     def proof(self):
         """Get the static proof, or None."""
@@ -97,7 +160,8 @@ class DDO:
             f'did must be of str type, got {did} of type {type(did)}'
         assert did.startswith(OCEAN_PREFIX), \
             f'"did" seems invalid, must start with {OCEAN_PREFIX} prefix.'
-        self._did = did
+        self._set_did(did)
+        self._changed()
         return did
 
     def add_public_key(self, did, public_key):
@@ -109,6 +173,7 @@ class DDO:
         logger.debug(f'Adding public key {public_key} to the did {did}')
         self._public_keys.append(
             PublicKeyBase(did, **{"owner": public_key, "type": PUBLIC_KEY_TYPE_ETHEREUM_ECDSA}))
+        self._changed()
 
     def add_authentication(self, public_key, authentication_type):
         """
@@ -122,6 +187,7 @@ class DDO:
             authentication = {'type': authentication_type, 'publicKey': public_key}
         logger.debug(f'Adding authentication {authentication}')
         self._authentications.append(authentication)
+        self._changed()
 
     def add_service(self, service_type, service_endpoint=None, values=None, index=None):
         """
@@ -138,7 +204,43 @@ class DDO:
             values = copy.deepcopy(values) if values else {}
             service = Service(service_endpoint, service_type, values.pop('attributes', None), values, index)
         logger.debug(f'Adding service with service type {service_type} with did {self._did}')
+        self._append_service(service)
+
+    def _append_service(self, service):
+        """Append a service and index it by type and index, the first one added wins."""
         self._services.append(service)
+        self._services_by_type.setdefault(service.type, service)
+        self._services_by_index.setdefault(service.index, service)
+        self._changed()
+
+    def invalidate(self):
+        """
+        Drop the rendered dict and text. The DDO methods changing it call it, call it after
+        changing the DDO in place, through the dicts returned by `metadata` or `proof`, the
+        public keys or a service attributes.
+        """
+        self._changed()
+        for service in self._services:
+            service.invalidate()
+
+    def _changed(self):
+        self._rendered.clear()
+
+    def _get_rendered(self, is_proof):
+        """
+        Return the [service versions, dict, text] entry rendered for `is_proof`, rendering it
+        again if a service changed since. The text is rendered on first use.
+        """
+        if self._created is None:
+            self._created = get_timestamp()
+            self._changed()
+
+        versions = tuple(service._version for service in self._services)
+        rendered = self._rendered.get(is_proof)
+        if rendered is None or rendered[0] != versions:
+            rendered = [versions, self._build_dictionary(is_proof), None]
+            self._rendered[is_proof] = rendered
+        return rendered
 
     def as_text(self, is_proof=True, is_pretty=False):
         """Return the DDO as a JSON text.
@@ -147,22 +249,82 @@ class DDO:
         :param is_pretty: If True return dictionary in a prettier way, bool
         :return: str
         """
-        data = self.as_dictionary(is_proof)
         if is_pretty:
+            data = self.as_dictionary(is_proof)
             return json.dumps(data, indent=2, separators=(',', ': '))
 
-        return json.dumps(data)
+        rendered = self._get_rendered(is_proof)
+        if rendered[2] is None:
+            rendered[2] = json.dumps(rendered[1])
+        return rendered[2]
+
+    def as_bytes(self, is_proof=True):
+        """Return the DDO in a compact binary encoding, requires msgpack.
+
+        :param if is_proof: if False then do not include the 'proof' element.
+        :return: bytes
+        """
+        return encode_ddo_dict(self.as_dictionary(is_proof))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Create a DDO from bytes returned by `as_bytes`.
+
+        :param data: bytes
+        :return: DDO
+        """
+        ddo = cls()
+        ddo._read_dict(decode_ddo_dict(data), copy_values=False)
+        return ddo
+
+    def diff(self, other):
+        """
+        Return the JSON Patch (RFC 6902) turning this DDO into `other`.
+
+        :param other: DDO
+        :return: list of JSON Patch operations
+        """
+        return make_patch(self.as_dictionary(), other.as_dictionary())
+
+    def apply_patch(self, patch):
+        """
+        Return a new DDO with a JSON Patch applied, this DDO is not changed.
+
+        :param patch: list of JSON Patch operations, like the ones returned by `diff`.
+        :return: DDO
+        """
+        ddo = DDO()
+        ddo._read_dict(apply_patch(self.as_dictionary(), patch), copy_values=False)
+        return ddo
+
+    def freeze(self):
+        """
+        Return a deeply immutable snapshot of the DDO, safe to share between threads.
+
+        :return: FrozenDDO
+        """
+        return FrozenDDO(self.as_dictionary())
 
     def as_dictionary(self, is_proof=True):
         """
         Return the DDO as a JSON dict.
 
+        The dict is rendered once and reused until the DDO changes, see `invalidate`. The
+        lists, public keys, services, service attributes and agreement templates are copied,
+        the other nested values are shared with the DDO like in a new rendering.
+
         :param if is_proof: if False then do not include the 'proof' element.
         :return: dict
         """
-        if self._created is None:
-            self._created = get_timestamp()
+        data = dict(self._get_rendered(is_proof)[1])
+        for key in ('publicKey', 'authentication'):
+            if key in data:
+                data[key] = [dict(value) for value in data[key]]
+        if 'service' in data:
+            data['service'] = [_copy_service_dict(service) for service in data['service']]
+        return data
 
+    def _build_dictionary(self, is_proof):
         data = {
             '@context': DID_DDO_CONTEXT_URL,
             'id': self._did,
@@ -191,10 +353,18 @@ class DDO:
 
         return data
 
-    def _read_dict(self, dictionary):
-        """Import a JSON dict into this DDO."""
-        values = copy.deepcopy(dictionary)
-        self._did = values.pop('id')
+    def _read_dict(self, dictionary, copy_values=True):
+        """Import a JSON dict into this DDO.
+
+        :param copy_values: False when the dict is not used by the caller afterwards
+            and can be owned by the DDO without a copy.
+        """
+        if is_interning_enabled():
+            # returns a copy with the repeated strings shared with the other DDOs.
+            values = intern_json(dictionary)
+        else:
+            values = copy.deepcopy(dictionary) if copy_values else dict(dictionary)
+        self._set_did(values.pop('id'))
         self._created = values.pop('created', None)
 
         if 'publicKey' in values:
@@ -211,6 +381,8 @@ class DDO:
                 self._authentications.append(DDO.create_authentication_from_json(value))
         if 'service' in values:
             self._services = []
+            self._services_by_type = {}
+            self._services_by_index = {}
             for value in values.pop('service'):
                 if isinstance(value, str):
                     value = json.loads(value)
@@ -222,19 +394,23 @@ class DDO:
                 else:
                     service = Service.from_json(value)
 
-                self._services.append(service)
+                self._append_service(service)
         if 'proof' in values:
             self._proof = values.pop('proof')
 
         self._other_values = values
+        self._changed()
 
     def add_proof(self, checksums, publisher_account):
         """Add a proof to the DDO, based on the public_key id/index and signed with the private key
         add a static proof to the DDO, based on one of the public keys.
 
-        :param checksums: dict with the checksum of the main attributes of each service, dict
+        :param checksums: dict with the checksum of the main attributes of each service, dict,
+            None to use `compute_checksums`.
         :param publisher_account: account of the publisher, account
         """
+        if checksums is None:
+            checksums = self.compute_checksums()
         self._proof = {
             'type': PROOF_TYPE,
             'created': get_timestamp(),
@@ -243,6 +419,20 @@ class DDO:
             'checksum': checksums
 
         }
+        self._changed()
+
+    def compute_checksums(self):
+        """
+        Return the checksum of the main attributes of each service, as expected by `add_proof`
+        and `DID.did`. The checksum of each service is cached until the service changes, call
+        `invalidate` after changing the main attributes in place.
+
+        :return: dict of str service index to checksum
+        """
+        return {
+            str(service.index): service.main_checksum()
+            for service in self._services if 'main' in service._attributes
+        }
 
     def get_public_key(self, key_id):
         """Key_id can be a string, or int. If int then the index in the list of keys."""
@@ -268,10 +458,9 @@ class DDO:
 
     def get_service(self, service_type=None):
         """Return a service using."""
-        for service in self._services:
-            if service.type == service_type and service_type:
-                return service
-        return None
+        if not service_type:
+            return None
+        return self._services_by_type.get(service_type)
 
     def get_service_by_index(self, index):
         """
@@ -286,9 +475,9 @@ class DDO:
             logging.error(f'The index {index} can not be converted into a int')
             return None
 
-        for service in self._services:
-            if service.index == index:
-                return service
+        service = self._services_by_index.get(index)
+        if service is not None:
+            return service
 
         # try to find by type
         return self.get_service(index)
@@ -0,0 +1,238 @@
+"""
+    Frozen DDO
+    Deeply immutable DDO snapshot that threads can share without copies.
+"""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import json
+from types import MappingProxyType
+
+from ocean_utils.agreements.service_types import ServiceTypes
+from ocean_utils.did import ParsedDID
+
+
+def freeze_value(value):
+    """
+    Return a deeply immutable copy of a JSON value, dicts become read-only mappings and
+    lists become tuples.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze_value(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_value(v) for v in value)
+    return value
+
+
+def thaw_value(value):
+    """Return a mutable copy of a value returned by `freeze_value`."""
+    if isinstance(value, MappingProxyType):
+        return {k: thaw_value(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_value(v) for v in value]
+    return value
+
+
+def freeze_ddo(value):
+    """
+    Return a `FrozenDDO` of a DDO, or the frozen value of anything returned in place of a
+    DDO (None, empty results).
+    """
+    if hasattr(value, 'freeze'):
+        return value.freeze()
+    return freeze_value(value)
+
+
+def thaw_ddo(value):
+    """Return a new mutable DDO, or value, from a value returned by `freeze_ddo`."""
+    if isinstance(value, FrozenDDO):
+        return value.thaw()
+    return thaw_value(value)
+
+
+class _Frozen:
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} is immutable.')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__name__} is immutable.')
+
+    def _init(self, **values):
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+
+class FrozenService(_Frozen):
+    """Immutable service of a `FrozenDDO`."""
+    __slots__ = ('_data',)
+
+    def __init__(self, service_dict):
+        """
+
+        :param service_dict: service dict, copied unless it is already frozen.
+        """
+        self._init(_data=freeze_value(service_dict))
+
+    @property
+    def type(self):
+        return self._data.get('type')
+
+    @property
+    def index(self):
+        return self._data.get('index')
+
+    @property
+    def service_endpoint(self):
+        return self._data.get('serviceEndpoint')
+
+    @property
+    def template_id(self):
+        return self._data.get('templateId')
+
+    @property
+    def attributes(self):
+        return self._data.get('attributes') or MappingProxyType({})
+
+    @property
+    def main(self):
+        return self.attributes['main']
+
+    @property
+    def conditions(self):
+        """Tuple of the frozen condition dicts of the agreement template, empty if none."""
+        template = self.attributes.get('serviceAgreementTemplate') or {}
+        return template.get('conditions', ())
+
+    def as_dictionary(self):
+        """Return a mutable copy of the service dict."""
+        return thaw_value(self._data)
+
+
+class FrozenDDO(_Frozen):
+    """
+    Deeply immutable snapshot of a DDO, see `DDO.freeze`.
+
+    All the nested values are read-only mappings and tuples, so the snapshot can be shared
+    between threads and accessors return the values without copying them. The hash is
+    computed once when the snapshot is created.
+    """
+    __slots__ = ('_data', '_services', '_services_by_type', '_services_by_index', '_text',
+                 '_hash')
+
+    def __init__(self, ddo_dict):
+        """
+
+        :param ddo_dict: dict as returned by `DDO.as_dictionary`, it is copied.
+        """
+        data = freeze_value(ddo_dict)
+        services = tuple(FrozenService(service) for service in data.get('service', ()))
+        services_by_type = {}
+        services_by_index = {}
+        for service in services:
+            services_by_type.setdefault(service.type, service)
+            services_by_index.setdefault(service.index, service)
+        text = json.dumps(ddo_dict, sort_keys=True)
+        self._init(
+            _data=data,
+            _services=services,
+            _services_by_type=MappingProxyType(services_by_type),
+            _services_by_index=MappingProxyType(services_by_index),
+            _text=text,
+            _hash=hash(text),
+        )
+
+    @property
+    def did(self):
+        return self._data.get('id')
+
+    @property
+    def asset_id(self):
+        return self._get_parsed_did().asset_id if self.did else None
+
+    @property
+    def asset_id_bytes(self):
+        return self._get_parsed_did().id_bytes if self.did else None
+
+    def _get_parsed_did(self):
+        """Parse the DID on access like `DDO`, `ParsedDID.from_did` memoizes the result."""
+        return ParsedDID.from_did(self.did)
+
+    @property
+    def created(self):
+        return self._data.get('created')
+
+    @property
+    def proof(self):
+        return self._data.get('proof')
+
+    @property
+    def publisher(self):
+        proof = self.proof
+        return proof.get('creator') if proof else None
+
+    @property
+    def metadata(self):
+        service = self.get_service(ServiceTypes.METADATA)
+        return service.attributes if service else None
+
+    @property
+    def services(self):
+        return self._services
+
+    @property
+    def public_keys(self):
+        return self._data.get('publicKey', ())
+
+    @property
+    def authentications(self):
+        return self._data.get('authentication', ())
+
+    def get_service(self, service_type=None):
+        return self._services_by_type.get(service_type) if service_type else None
+
+    def get_service_by_index(self, index):
+        try:
+            index = int(index)
+        except ValueError:
+            return None
+
+        service = self._services_by_index.get(index)
+        if service is not None:
+            return service
+
+        # try to find by type
+        return self.get_service(index)
+
+    def as_dictionary(self, is_proof=True):
+        """Return a mutable copy of the DDO dict."""
+        data = thaw_value(self._data)
+        if not is_proof:
+            data.pop('proof', None)
+        return data
+
+    def as_text(self, is_proof=True):
+        """Return the DDO as a JSON text, with sorted keys."""
+        if is_proof or 'proof' not in self._data:
+            return self._text
+        return json.dumps(self.as_dictionary(is_proof), sort_keys=True)
+
+    def thaw(self):
+        """Return a mutable DDO with the same content."""
+        from ocean_utils.ddo.ddo import DDO
+        ddo = DDO()
+        ddo._read_dict(self.as_dictionary(), copy_values=False)
+        return ddo
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenDDO):
+            return NotImplemented
+        return self._hash == other._hash and self._text == other._text
+
+    def __repr__(self):
+        return f'FrozenDDO({self.did!r})'
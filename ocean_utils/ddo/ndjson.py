@@ -0,0 +1,204 @@
+"""
+    NDJSON files of DDOs
+    Stream DDOs from and to newline-delimited JSON files, optionally compressed.
+"""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import gzip
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from ocean_utils.ddo.ddo import DDO
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DEFAULT_CHUNK_SIZE = 256
+
+
+def open_ndjson(path, mode='rt'):
+    """
+    Open an NDJSON file, the compression is picked from the extension: `.gz` for gzip,
+    `.zst` for zstandard (requires the zstandard package), anything else is uncompressed.
+
+    :param path: str or Path of the file
+    :param mode: 'rt' to read, 'wt' to write, 'at' to append.
+    :return: text file object
+    """
+    path = str(path)
+    if path.endswith('.gz'):
+        return gzip.open(path, mode, compresslevel=6, encoding='utf-8')
+    if path.endswith('.zst'):
+        if zstandard is None:
+            raise ImportError('zstandard is required to read and write .zst files.')
+        return zstandard.open(path, mode, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def _encode_chunk(ddo_dicts):
+    return ''.join(json.dumps(ddo_dict, separators=(',', ':')) + '\n' for ddo_dict in ddo_dicts)
+
+
+def _decode_chunk(first_line_number, lines):
+    ddo_dicts = []
+    for line_number, line in enumerate(lines, first_line_number):
+        if not line.strip():
+            continue
+        try:
+            ddo_dicts.append(json.loads(line))
+        except ValueError as e:
+            raise ValueError(f'Invalid DDO on line {line_number}: {e}')
+    return ddo_dicts
+
+
+def _iter_chunks(lines, chunk_size):
+    chunk = []
+    first_line_number = 1
+    for line_number, line in enumerate(lines, 1):
+        chunk.append(line)
+        if len(chunk) == chunk_size:
+            yield first_line_number, chunk
+            chunk = []
+            first_line_number = line_number + 1
+    if chunk:
+        yield first_line_number, chunk
+
+
+def read_ddo_dicts(path, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Read the DDO dicts of an NDJSON file, one DDO per line, in file order.
+
+    :param path: str or Path of the file, see `open_ndjson`.
+    :param workers: int number of processes parsing the lines, None or 0 to parse in
+        the calling process.
+    :param chunk_size: int number of lines sent at once to a worker.
+    :return: generator of DDO dicts
+    """
+    with open_ndjson(path, 'rt') as f:
+        chunks = _iter_chunks(f, chunk_size)
+        if not workers:
+            for first_line_number, lines in chunks:
+                yield from _decode_chunk(first_line_number, lines)
+            return
+
+        with ProcessPoolExecutor(workers) as executor:
+            # keep a bounded number of chunks in flight so the file is not read ahead of
+            # the consumer.
+            pending = deque()
+            for first_line_number, lines in chunks:
+                pending.append(executor.submit(_decode_chunk, first_line_number, lines))
+                if len(pending) > 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+
+def read_ddos(path, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Read the DDOs of an NDJSON file, see `read_ddo_dicts`.
+
+    :return: generator of DDO instances
+    """
+    for ddo_dict in read_ddo_dicts(path, workers, chunk_size):
+        yield DDO(dictionary=ddo_dict)
+
+
+class NDJSONWriter:
+    """
+    Write DDOs to an NDJSON file, one DDO per line, in the order they are written.
+
+    When using workers, at most `max_pending` chunks wait to be written, `write` blocks
+    on the oldest chunk when the limit is reached so memory use stays bounded when the
+    DDOs are produced faster than the file is written.
+
+    Use as a context manager or call `close` to flush the last DDOs.
+    """
+
+    def __init__(self, path, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, max_pending=None,
+                 mode='wt'):
+        """
+
+        :param path: str or Path of the file, see `open_ndjson`.
+        :param workers: int number of processes serializing the DDOs, None or 0 to serialize
+            in the calling process.
+        :param chunk_size: int number of DDOs sent at once to a worker.
+        :param max_pending: int max number of chunks being serialized, defaults to twice
+            the number of workers.
+        :param mode: 'wt' to overwrite the file, 'at' to append to it.
+        """
+        self._file = open_ndjson(path, mode)
+        self._executor = ProcessPoolExecutor(workers) if workers else None
+        self._chunk_size = chunk_size
+        self._max_pending = max_pending or 2 * (workers or 1)
+        self._chunk = []
+        self._pending = deque()
+        self._count = 0
+
+    @property
+    def count(self):
+        """Number of DDOs written so far."""
+        return self._count
+
+    def write(self, ddo):
+        """
+        Write a DDO.
+
+        :param ddo: DDO instance or DDO dict
+        """
+        self._chunk.append(ddo.as_dictionary() if isinstance(ddo, DDO) else ddo)
+        self._count += 1
+        if len(self._chunk) >= self._chunk_size:
+            self._flush_chunk()
+
+    def write_many(self, ddos):
+        """Write DDOs, see `write`."""
+        for ddo in ddos:
+            self.write(ddo)
+
+    def _flush_chunk(self):
+        chunk, self._chunk = self._chunk, []
+        if not chunk:
+            return
+
+        if self._executor is None:
+            self._file.write(_encode_chunk(chunk))
+            return
+
+        self._pending.append(self._executor.submit(_encode_chunk, chunk))
+        while len(self._pending) > self._max_pending:
+            self._file.write(self._pending.popleft().result())
+
+    def close(self):
+        """Write the remaining DDOs and close the file."""
+        try:
+            self._flush_chunk()
+            while self._pending:
+                self._file.write(self._pending.popleft().result())
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def write_ddos(path, ddos, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Write DDOs to an NDJSON file, see `NDJSONWriter`.
+
+    :param path: str or Path of the file
+    :param ddos: iterable of DDO instances or DDO dicts
+    :return: int number of DDOs written
+    """
+    with NDJSONWriter(path, workers, chunk_size) as writer:
+        writer.write_many(ddos)
+    return writer.count
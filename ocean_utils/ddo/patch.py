@@ -0,0 +1,176 @@
+"""
+    DDO patches
+    Structural diff of DDO dicts as JSON Patch (RFC 6902) operations, and their application.
+"""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import copy
+
+
+def _escape(key):
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+
+def _unescape(token):
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def _same(source, target):
+    # 1 == True and 1 == 1.0 in python but they are different JSON values.
+    return type(source) is type(target) and source == target
+
+
+def _diff(source, target, path, operations):
+    if _same(source, target):
+        return
+
+    if isinstance(source, dict) and isinstance(target, dict):
+        for key, value in source.items():
+            if key not in target:
+                operations.append({'op': 'remove', 'path': f'{path}/{_escape(key)}'})
+        for key, value in target.items():
+            key_path = f'{path}/{_escape(key)}'
+            if key not in source:
+                operations.append({'op': 'add', 'path': key_path, 'value': copy.deepcopy(value)})
+            else:
+                _diff(source[key], value, key_path, operations)
+        return
+
+    if isinstance(source, list) and isinstance(target, list):
+        common = min(len(source), len(target))
+        for i in range(common):
+            _diff(source[i], target[i], f'{path}/{i}', operations)
+        for i in range(common, len(target)):
+            operations.append({'op': 'add', 'path': f'{path}/-', 'value': copy.deepcopy(target[i])})
+        # remove from the end so the indexes of the remaining items do not change.
+        for i in reversed(range(common, len(source))):
+            operations.append({'op': 'remove', 'path': f'{path}/{i}'})
+        return
+
+    operations.append({'op': 'replace', 'path': path, 'value': copy.deepcopy(target)})
+
+
+def make_patch(source, target):
+    """
+    Compute the JSON Patch turning `source` into `target`.
+
+    Dicts are compared key by key and lists item by item, so changing one nested value gives
+    a single `replace` operation.
+
+    :param source: JSON value, like a DDO dict
+    :param target: JSON value
+    :return: list of JSON Patch operations
+    """
+    operations = []
+    _diff(source, target, '', operations)
+    return operations
+
+
+def guard_patch(source, patch):
+    """
+    Return a DDO patch preceded by `test` operations checking that the document it is applied
+    to has the id of `source` and, for each service the patch touches by position, the type
+    and index the service has in `source`. Applied to a document that diverged from `source`
+    the guarded patch fails instead of changing the wrong service.
+
+    :param source: DDO dict the patch was computed from, see `make_patch`.
+    :param patch: list of JSON Patch operations
+    :return: list of JSON Patch operations
+    """
+    tests = []
+    if 'id' in source:
+        tests.append({'op': 'test', 'path': '/id', 'value': source['id']})
+    services = source.get('service') or []
+    positions = set()
+    for operation in patch:
+        tokens = operation.get('path', '').split('/')
+        if len(tokens) > 2 and tokens[1] == 'service' and tokens[2].isdigit():
+            positions.add(int(tokens[2]))
+    for position in sorted(positions):
+        if position >= len(services):
+            continue
+        for key in ('type', 'index'):
+            if key in services[position]:
+                tests.append({
+                    'op': 'test',
+                    'path': f'/service/{position}/{key}',
+                    'value': copy.deepcopy(services[position][key])
+                })
+    return tests + list(patch)
+
+
+def _resolve(document, tokens, path):
+    parent = document
+    for token in tokens:
+        try:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        except (KeyError, IndexError, ValueError, TypeError):
+            raise ValueError(f'Invalid patch path {path}, {token} not found.')
+    return parent
+
+
+def _apply_operation(document, operation):
+    op = operation.get('op')
+    path = operation.get('path')
+    if path is None or (path and not path.startswith('/')):
+        raise ValueError(f'Invalid patch path {path}.')
+    if path == '':
+        if op in ('add', 'replace'):
+            return copy.deepcopy(operation['value'])
+        if op == 'test':
+            if not _same(document, operation['value']):
+                raise ValueError(f'Patch test failed at {path}.')
+            return document
+        raise ValueError(f'Unsupported patch operation {op} on the document root.')
+
+    tokens = [_unescape(token) for token in path[1:].split('/')]
+    parent = _resolve(document, tokens[:-1], path)
+    key = tokens[-1]
+    if isinstance(parent, list):
+        if key == '-' and op == 'add':
+            index = len(parent)
+        else:
+            try:
+                index = int(key)
+            except ValueError:
+                raise ValueError(f'Invalid patch path {path}, {key} is not a list index.')
+            if not 0 <= index < len(parent) + (op == 'add'):
+                raise ValueError(f'Invalid patch path {path}, index out of range.')
+        key = index
+    elif not isinstance(parent, dict):
+        raise ValueError(f'Invalid patch path {path}.')
+    elif op in ('remove', 'replace', 'test') and key not in parent:
+        raise ValueError(f'Invalid patch path {path}, {key} not found.')
+
+    if op == 'add':
+        value = copy.deepcopy(operation['value'])
+        if isinstance(parent, list):
+            parent.insert(key, value)
+        else:
+            parent[key] = value
+    elif op == 'remove':
+        del parent[key]
+    elif op == 'replace':
+        parent[key] = copy.deepcopy(operation['value'])
+    elif op == 'test':
+        if not _same(parent[key], operation['value']):
+            raise ValueError(f'Patch test failed at {path}.')
+    else:
+        raise ValueError(f'Unsupported patch operation {op}.')
+    return document
+
+
+def apply_patch(document, patch):
+    """
+    Apply a JSON Patch, the `add`, `remove`, `replace` and `test` operations are supported.
+
+    :param document: JSON value, not changed.
+    :param patch: list of JSON Patch operations
+    :return: patched copy of the document
+    """
+    document = copy.deepcopy(document)
+    for operation in patch:
+        document = _apply_operation(document, operation)
+    return document
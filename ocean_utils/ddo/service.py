@@ -9,6 +9,9 @@ import copy
 import json
 import logging
 
+from ocean_utils.utils.interning import intern_json, intern_string, is_interning_enabled
+from ocean_utils.utils.utilities import checksum
+
 # from ocean_commons.agreements.service_agreement import ServiceAgreement
 # from ocean_commons.agreements.service_types import ServiceTypes
 
@@ -28,6 +31,10 @@ class Service:
         self._type = service_type or ''
         self._index = index
         self._attributes = attributes or {}
+        # bumped on every change, see `invalidate`.
+        self._version = 0
+        # (version, checksum) of the main attributes, see `main_checksum`.
+        self._main_checksum = None
 
         # assign the _values property to empty until they are used
         self._values = dict()
@@ -71,6 +78,7 @@ class Service:
         :param service_endpoint: Service endpoint, str
         """
         self._service_endpoint = service_endpoint
+        self.invalidate()
 
     def values(self):
         """
@@ -87,6 +95,16 @@ class Service:
     def main(self):
         return self._attributes['main']
 
+    def main_checksum(self):
+        """
+        Checksum of the main attributes, cached until the service changes, see `invalidate`.
+
+        :return: str
+        """
+        if self._main_checksum is None or self._main_checksum[0] != self._version:
+            self._main_checksum = (self._version, checksum(self._attributes['main']))
+        return self._main_checksum[1]
+
     def update_value(self, name, value):
         """
         Update value in the array of values.
@@ -97,6 +115,15 @@ class Service:
         """
         if name not in self._reserved_names:
             self._values[name] = value
+            self.invalidate()
+
+    def invalidate(self):
+        """
+        Mark the service as changed. The setters call it, call it after changing the attributes
+        in place so that the DDOs holding this service render it again and its checksum is
+        computed again.
+        """
+        self._version += 1
 
     def as_text(self, is_pretty=False):
         """Return the service as a JSON string."""
@@ -132,8 +159,11 @@ class Service:
 
     @classmethod
     def _parse_json(cls, service_dict):
-        sd = copy.deepcopy(service_dict)
-        service_endpoint = sd.pop(cls.SERVICE_ENDPOINT, None)
+        if is_interning_enabled():
+            sd = intern_json(service_dict)
+        else:
+            sd = copy.deepcopy(service_dict)
+        service_endpoint = intern_string(sd.pop(cls.SERVICE_ENDPOINT, None))
         _type = sd.pop(cls.SERVICE_TYPE, None)
         _index = sd.pop(cls.SERVICE_INDEX, None)
         _attributes = sd.pop(cls.SERVICE_ATTRIBUTES, None)
@@ -3,13 +3,26 @@
 #  SPDX-License-Identifier: Apache-2.0
 
 import re
+from collections import namedtuple
+from functools import lru_cache
 
-from eth_utils import remove_0x_prefix
+from eth_utils import add_0x_prefix, remove_0x_prefix
 from web3 import Web3
 
-from ocean_utils.utils.utilities import checksum
+from ocean_utils.utils.utilities import checksum, checksum_many
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 OCEAN_PREFIX = 'did:op:'
+DID_PARSE_CACHE_SIZE = 4096
+
+_DID_PATTERN = re.compile('^did:([a-z0-9]+):([a-zA-Z0-9-.]+)(.*)')
+_HEX_ID_PATTERN = re.compile('^[0x]?[0-9A-Za-z]+$')
+_HEX_PATTERN = re.compile('^[0-9a-fA-F]*$')
+DID_ID_BYTES_LENGTH = 32
 
 
 class DID:
@@ -28,6 +41,55 @@ class DID:
         """
         return OCEAN_PREFIX + remove_0x_prefix(checksum(seed))
 
+    @staticmethod
+    def did_many(seeds):
+        """
+        Create the dids of many assets, see `did`.
+
+        :param seeds: iterable of the checksums dicts allocated in the proofs
+        :return: list of asset dids
+        """
+        return [OCEAN_PREFIX + remove_0x_prefix(value) for value in checksum_many(seeds)]
+
+
+class ParsedDID(namedtuple('ParsedDID', ('did', 'method', 'id', 'id_bytes'))):
+    """
+    Immutable parts of a parsed DID.
+
+    `id_bytes` is None when the id part is not a valid hex value.
+    """
+    __slots__ = ()
+
+    @property
+    def asset_id(self):
+        """The id part of the DID with the 0x prefix."""
+        return add_0x_prefix(self.id)
+
+    @staticmethod
+    def from_did(did):
+        """
+        Parse a DID, results are memoized in a bounded LRU cache.
+
+        :param did: Asset did, str.
+        :return: ParsedDID instance
+        """
+        if not isinstance(did, str):
+            raise TypeError(f'Expecting DID of string type, got {did} of {type(did)} type')
+
+        return _parse_did(did)
+
+
+@lru_cache(maxsize=DID_PARSE_CACHE_SIZE)
+def _parse_did(did):
+    match = _match_did(did)
+    _id = match.group(2)
+    try:
+        id_bytes = Web3.toBytes(hexstr=_id)
+    except ValueError:
+        id_bytes = None
+
+    return ParsedDID(did, match.group(1), _id, id_bytes)
+
 
 def did_parse(did):
     """
@@ -36,20 +98,12 @@ def did_parse(did):
     :param did: Asset did, str.
     :return: Python dictionary with the method and the id.
     """
-    if not isinstance(did, str):
-        raise TypeError(f'Expecting DID of string type, got {did} of {type(did)} type')
-
-    match = re.match('^did:([a-z0-9]+):([a-zA-Z0-9-.]+)(.*)', did)
-    if not match:
-        raise ValueError(f'DID {did} does not seem to be valid.')
-
-    result = {
-        'method': match.group(1),
-        'id': match.group(2),
+    parsed = ParsedDID.from_did(did)
+    return {
+        'method': parsed.method,
+        'id': parsed.id,
     }
 
-    return result
-
 
 def is_did_valid(did):
     """
@@ -61,10 +115,7 @@ def is_did_valid(did):
     :param did: Asset did, str
     :return bool
     """
-    result = did_parse(did)
-    if result:
-        return result['id'] is not None
-    return False
+    return ParsedDID.from_did(did).id is not None
 
 
 def id_to_did(did_id, method='op'):
@@ -86,10 +137,7 @@ def id_to_did(did_id, method='op'):
 
 def did_to_id(did):
     """Return an id extracted from a DID string."""
-    result = did_parse(did)
-    if result and result['id'] is not None:
-        return result['id']
-    return None
+    return ParsedDID.from_did(did).id
 
 
 def did_to_id_bytes(did):
@@ -99,15 +147,12 @@ def did_to_id_bytes(did):
     So did:op:<hex>, will return <hex> in byte format
     """
     if isinstance(did, str):
-        if re.match('^[0x]?[0-9A-Za-z]+$', did):
+        if _HEX_ID_PATTERN.match(did):
             raise ValueError(f'{did} must be a DID not a hex string')
         else:
-            did_result = did_parse(did)
-            if not did_result:
-                raise ValueError(f'{did} is not a valid did')
-            if not did_result['id']:
+            id_bytes = ParsedDID.from_did(did).id_bytes
+            if id_bytes is None:
                 raise ValueError(f'{did} is not a valid ocean did')
-            id_bytes = Web3.toBytes(hexstr=did_result['id'])
     elif isinstance(did, bytes):
         id_bytes = did
     else:
@@ -115,3 +160,96 @@ def did_to_id_bytes(did):
             f'Unknown did format, expected str or bytes, got {did} of type {type(did)}'
         )
     return id_bytes
+
+
+def ids_to_dids(did_ids, method='op'):
+    """
+    Return the Ocean DIDs of a sequence of hex ids, same as calling `id_to_did` on each one.
+
+    :param did_ids: sequence of hex str or bytes ids, or a 2 dimensional numpy uint8 array
+        with one id per row as returned by `dids_to_id_bytes(dids, as_array=True)`.
+    :param method: DID method, str
+    :return: list of DID str
+    """
+    prefix = f'did:{method}:'
+    if numpy is not None and isinstance(did_ids, numpy.ndarray):
+        if did_ids.ndim != 2:
+            raise ValueError(
+                f'Expecting a 2 dimensional array of ids, got {did_ids.ndim} dimensions')
+        width = did_ids.shape[1] * 2
+        hex_ids = did_ids.astype(numpy.uint8, copy=False).tobytes().hex()
+        return [prefix + hex_ids[i:i + width] for i in range(0, len(hex_ids), width)]
+
+    dids = []
+    for did_id in did_ids:
+        if isinstance(did_id, bytes):
+            did_id = did_id.hex()
+        elif isinstance(did_id, str):
+            if did_id.startswith(('0x', '0X')):
+                did_id = did_id[2:]
+            if not _HEX_PATTERN.match(did_id):
+                raise ValueError(f'did id {did_id} is not a hex string')
+        else:
+            raise TypeError("did id must be a hex string or bytes")
+
+        dids.append(prefix + (did_id or '0'))
+    return dids
+
+
+def _match_did(did):
+    if not isinstance(did, str):
+        raise TypeError(f'Expecting DID of string type, got {did} of {type(did)} type')
+
+    match = _DID_PATTERN.match(did)
+    if not match:
+        raise ValueError(f'DID {did} does not seem to be valid.')
+    return match
+
+
+def dids_to_ids(dids):
+    """
+    Return the ids of a sequence of DIDs, same as calling `did_to_id` on each one.
+
+    The parse cache is bypassed so converting large sequences does not evict hot entries.
+
+    :param dids: sequence of DID str
+    :return: list of id str
+    """
+    return [_match_did(did).group(2) for did in dids]
+
+
+def dids_to_id_bytes(dids, as_array=False):
+    """
+    Return the ids in bytes of a sequence of DIDs, same as calling `did_to_id_bytes` on each one.
+
+    :param dids: sequence of DID str or id bytes
+    :param as_array: if True return a numpy uint8 array of shape (len(dids), 32) with each
+        id left padded with zeros to 32 bytes, requires numpy.
+    :return: list of bytes or numpy array
+    """
+    ids_bytes = []
+    for did in dids:
+        if isinstance(did, bytes):
+            ids_bytes.append(did)
+            continue
+
+        _id = remove_0x_prefix(_match_did(did).group(2))
+        try:
+            ids_bytes.append(bytes.fromhex(_id if len(_id) % 2 == 0 else f'0{_id}'))
+        except ValueError:
+            raise ValueError(f'{did} is not a valid ocean did')
+
+    if not as_array:
+        return ids_bytes
+
+    if numpy is None:
+        raise ImportError('numpy is required to return the ids as an array.')
+
+    buffer = bytearray(DID_ID_BYTES_LENGTH * len(ids_bytes))
+    for i, id_bytes in enumerate(ids_bytes):
+        if len(id_bytes) > DID_ID_BYTES_LENGTH:
+            raise ValueError(f'id {id_bytes} is longer than {DID_ID_BYTES_LENGTH} bytes')
+        end = (i + 1) * DID_ID_BYTES_LENGTH
+        buffer[end - len(id_bytes):end] = id_bytes
+
+    return numpy.frombuffer(buffer, dtype=numpy.uint8).reshape(len(ids_bytes), DID_ID_BYTES_LENGTH)
@@ -0,0 +1,88 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import logging
+
+from ocean_utils.aquarius.async_aquarius import AsyncAquarius
+from ocean_utils.did import did_to_id_bytes
+from ocean_utils.utils.single_flight import AsyncSingleFlight
+
+logger = logging.getLogger('keeper')
+
+
+class AsyncDIDResolver:
+    """
+    Asyncio DID Resolver class
+    Resolve DID to a URL/DDO without blocking the event loop.
+    """
+
+    def __init__(self, did_registry, aquarius_factory=AsyncAquarius, timeout=None):
+        """
+
+        :param did_registry: object with an async `get_registered_attribute(did_bytes)` method.
+        :param aquarius_factory: callable returning an async Aquarius client for a url, clients
+            are created once per url and reused.
+        :param timeout: default timeout in seconds of a resolve, None to wait indefinitely.
+        """
+        self._did_registry = did_registry
+        self._aquarius_factory = aquarius_factory
+        self._timeout = timeout
+        self._aquarius_clients = {}
+        self._single_flight = AsyncSingleFlight()
+
+    async def resolve(self, did, timeout=None):
+        """
+        Resolve a DID to an URL/DDO or later an internal/external DID.
+
+        Concurrent calls for the same DID share a single registry lookup and metadata store
+        request. Cancelling a resolve, or timing out, does not cancel the shared request for the
+        other callers.
+
+        :param did: 32 byte value or DID string to resolver, this is part of the ocean
+            DID did:op:<32 byte value>
+        :param timeout: timeout in seconds, overrides the default timeout of the resolver.
+        :return string: URL or DDO of the resolved DID
+        :return None: if the DID cannot be resolved
+        :raises ValueError: if did is invalid
+        :raises TypeError: if did has invalid format
+        :raises asyncio.TimeoutError: if the DID is not resolved within the timeout.
+        """
+        timeout = self._timeout if timeout is None else timeout
+        return await asyncio.wait_for(self._single_flight.do(did, self._resolve, did), timeout)
+
+    async def _resolve(self, did):
+        did_bytes = did_to_id_bytes(did)
+        if not isinstance(did_bytes, bytes):
+            raise TypeError('Invalid did: a 32 Byte DID value required.')
+
+        url = await self.get_resolve_url(did_bytes)
+        logger.debug(f'found did {did} -> url={url}')
+        return await self._get_aquarius(url).get_asset_ddo(did)
+
+    async def get_resolve_url(self, did_bytes):
+        """Return a did value and value type from the block chain event record using 'did'.
+
+        :param did_bytes: DID, hex-str
+        :return url: Url, str
+        """
+        data = await self._did_registry.get_registered_attribute(did_bytes)
+        if not (data and data.get('value')):
+            return None
+
+        return data['value']
+
+    def _get_aquarius(self, url):
+        aquarius = self._aquarius_clients.get(url)
+        if aquarius is None:
+            aquarius = self._aquarius_factory(url)
+            self._aquarius_clients[url] = aquarius
+        return aquarius
+
+    async def close(self):
+        """Close the Aquarius clients created by this resolver."""
+        clients, self._aquarius_clients = self._aquarius_clients, {}
+        for aquarius in clients.values():
+            close = getattr(aquarius, 'close', None)
+            if close is not None:
+                await close()
@@ -3,12 +3,23 @@
 #  SPDX-License-Identifier: Apache-2.0
 
 import logging
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from ocean_keeper.exceptions import OceanDIDNotFound
 
 from ocean_utils.aquarius.aquarius_provider import AquariusProvider
+from ocean_utils.ddo.frozen import freeze_ddo
 from ocean_utils.did import did_to_id_bytes
+from ocean_utils.utils.single_flight import SingleFlight
 
 logger = logging.getLogger('keeper')
 
+ResolvedDID = namedtuple('ResolvedDID', ('did', 'ddo', 'error'))
+
+# url of the DIDs that are not in `known_dids`.
+_UNKNOWN = object()
+
 
 class DIDResolver:
     """
@@ -16,13 +27,29 @@ class DIDResolver:
     Resolve DID to a URL/DDO.
     """
 
-    def __init__(self, did_registry):
+    def __init__(self, did_registry, ddo_cache=None, known_dids=None):
+        """
+
+        :param did_registry: DIDRegistry keeper contract instance
+        :param ddo_cache: optional RefreshAheadCache instance used to cache resolved DDOs, they
+            are cached and returned as shared `FrozenDDO` snapshots, call `thaw()` to edit one.
+        :param known_dids: optional KnownDIDs instance, DIDs that are certainly not in it are
+            not found without querying the registry or the metadata store.
+        """
         self._did_registry = did_registry
+        self._ddo_cache = ddo_cache
+        self._known_dids = known_dids
+        self._single_flight = SingleFlight()
 
     def resolve(self, did):
         """
         Resolve a DID to an URL/DDO or later an internal/external DID.
 
+        Concurrent calls for the same DID are coalesced into a single registry lookup and
+        metadata store request, all the callers get the same DDO instance. When the resolver has
+        a `ddo_cache` the DDO is served from it as a `FrozenDDO` and refreshed ahead of its
+        expiry.
+
         :param did: 32 byte value or DID string to resolver, this is part of the ocean
             DID did:op:<32 byte value>
         :return string: URL or DDO of the resolved DID
@@ -33,16 +60,117 @@ class DIDResolver:
         :raises TypeError: on any of the resolved values are not string/DID bytes.
         :raises OceanDIDNotFound: if no DID can be found to resolve.
         """
+        if self._ddo_cache is not None:
+            return self._ddo_cache.get(did, self._resolve_frozen, did)
+        return self._resolve_once(did)
+
+    def _resolve_once(self, did):
+        return self._single_flight.do(did, self._resolve, did)
+
+    def _resolve_frozen(self, did):
+        # the cache already coalesces its loads, and must not join a load started before an
+        # invalidation.
+        return freeze_ddo(self._resolve(did))
 
+    def _resolve(self, did):
         did_bytes = did_to_id_bytes(did)
         if not isinstance(did_bytes, bytes):
             raise TypeError('Invalid did: a 32 Byte DID value required.')
 
+        if self._known_dids is not None and did_bytes not in self._known_dids:
+            raise OceanDIDNotFound(f'DID {did} is unknown.')
+
         # resolve a DID to a DDO
         url = self.get_resolve_url(did_bytes)
         logger.debug(f'found did {did} -> url={url}')
         return AquariusProvider.get_aquarius(url).get_asset_ddo(did)
 
+    def resolve_many(self, dids, max_workers=10):
+        """
+        Resolve a batch of DIDs.
+
+        The registry attributes of all the DIDs are looked up first, then the DIDs are grouped
+        by metadata store url and each group is fetched through a single Aquarius instance.
+        Registry lookups and fetches run concurrently on a pool of `max_workers` threads. DIDs
+        found in the `ddo_cache` are not looked up and, like the fetched ones, are returned as
+        `FrozenDDO` snapshots. DIDs that are not in `known_dids` are not looked up.
+
+        :param dids: list of DID strings or 32 byte values
+        :param max_workers: int max number of concurrent lookups/requests
+        :return: list of ResolvedDID(did, ddo, error) in the same order as `dids`, `error` is
+            the exception raised while resolving that DID or None. DIDs without a registered
+            url or not in `known_dids` get an `OceanDIDNotFound` error.
+        """
+        dids = list(dids)
+        results = [None] * len(dids)
+        pending = range(len(dids))
+        generations = {}
+        if self._ddo_cache is not None:
+            pending = []
+            for i, did in enumerate(dids):
+                found, value = self._ddo_cache.lookup(did, self._resolve_frozen, did)
+                if found:
+                    results[i] = ResolvedDID(did, value, None)
+                else:
+                    pending.append(i)
+                    generations.setdefault(did, self._ddo_cache.generation(did))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            url_futures = [(i, executor.submit(self._get_did_url, dids[i])) for i in pending]
+            indices_by_url = {}
+            for i, future in url_futures:
+                try:
+                    url = future.result()
+                except Exception as e:
+                    results[i] = ResolvedDID(dids[i], None, e)
+                    continue
+                if url is _UNKNOWN:
+                    results[i] = ResolvedDID(
+                        dids[i], None, OceanDIDNotFound(f'DID {dids[i]} is unknown.'))
+                    continue
+                if url is None:
+                    results[i] = ResolvedDID(
+                        dids[i], None, OceanDIDNotFound(f'No url registered for did {dids[i]}.'))
+                    continue
+                indices_by_url.setdefault(url, {}).setdefault(dids[i], []).append(i)
+
+            ddo_futures = []
+            for url, indices_by_did in indices_by_url.items():
+                try:
+                    aquarius = AquariusProvider.get_aquarius(url)
+                except Exception as e:
+                    for indices in indices_by_did.values():
+                        for i in indices:
+                            results[i] = ResolvedDID(dids[i], None, e)
+                    continue
+
+                logger.debug(f'resolving {len(indices_by_did)} dids from url={url}')
+                for did, indices in indices_by_did.items():
+                    ddo_futures.append(
+                        (did, indices, executor.submit(aquarius.get_asset_ddo, did)))
+
+            for did, indices, future in ddo_futures:
+                try:
+                    ddo, error = future.result(), None
+                except Exception as e:
+                    ddo, error = None, e
+                else:
+                    if self._ddo_cache is not None:
+                        ddo = freeze_ddo(ddo)
+                        self._ddo_cache.put(did, ddo, generations[did])
+                for i in indices:
+                    results[i] = ResolvedDID(dids[i], ddo, error)
+
+        return results
+
+    def _get_did_url(self, did):
+        did_bytes = did_to_id_bytes(did)
+        if not isinstance(did_bytes, bytes):
+            raise TypeError('Invalid did: a 32 Byte DID value required.')
+        if self._known_dids is not None and did_bytes not in self._known_dids:
+            return _UNKNOWN
+        return self.get_resolve_url(did_bytes)
+
     def get_resolve_url(self, did_bytes):
         """Return a did value and value type from the block chain event record using 'did'.
 
@@ -0,0 +1,89 @@
+"""Counting bloom filter."""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import math
+
+_MAX_COUNT = 255
+
+
+class CountingBloomFilter:
+    """
+    Probabilistic set supporting removal.
+
+    `key in bloom_filter` is False only if the key was certainly never added (or was removed),
+    it is True for keys that were added and for a small fraction (`error_rate`) of other keys.
+    Each slot is a one byte counter, counters that reach 255 saturate and are never decremented
+    so removal can not introduce false negatives.
+    """
+
+    def __init__(self, capacity, error_rate=0.01):
+        """
+
+        :param capacity: int expected number of keys, the error rate grows past this number.
+        :param error_rate: float target false positive rate.
+        """
+        assert capacity > 0, f'Invalid capacity {capacity}, must be > 0.'
+        assert 0 < error_rate < 1, f'Invalid error_rate {error_rate}, must be in (0, 1).'
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._size = max(1, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self._hash_count = max(1, int(round(self._size / capacity * math.log(2))))
+        self._counters = bytearray(self._size)
+        self._count = 0
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def error_rate(self):
+        return self._error_rate
+
+    def _positions(self, key):
+        if isinstance(key, str):
+            key = key.encode('utf-8')
+        digest = hashlib.sha256(key).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:16], 'little') | 1
+        return [(h1 + i * h2) % self._size for i in range(self._hash_count)]
+
+    def add(self, key):
+        """Add a key, str or bytes."""
+        counters = self._counters
+        for position in self._positions(key):
+            if counters[position] < _MAX_COUNT:
+                counters[position] += 1
+        self._count += 1
+
+    def discard(self, key):
+        """
+        Remove a key that was previously added.
+
+        Keys that are certainly not in the filter are ignored, but a key that was never added
+        and is a false positive decrements the counters of other keys, which can then be
+        reported as absent. Only discard keys known to have been added.
+        """
+        positions = self._positions(key)
+        counters = self._counters
+        if not all(counters[position] for position in positions):
+            return
+        for position in positions:
+            if counters[position] < _MAX_COUNT:
+                counters[position] -= 1
+        self._count -= 1
+
+    def clear(self):
+        """Remove all the keys."""
+        self._counters = bytearray(self._size)
+        self._count = 0
+
+    def __contains__(self, key):
+        counters = self._counters
+        return all(counters[position] for position in self._positions(key))
+
+    def __len__(self):
+        """Approximate number of keys in the filter."""
+        return self._count
@@ -0,0 +1,77 @@
+"""
+    Opt-in interning of the strings repeated across DDOs.
+
+    DDOs of the same catalog share most of their vocabulary: dict keys, service types,
+    contract, function, event and parameter names of the agreement templates, endpoints...
+    When enabled, the parsers replace these strings by a single shared instance.
+"""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import copy
+import sys
+from collections.abc import Mapping
+
+# Keys whose string values are vocabulary rather than asset specific data. The values of
+# other keys are kept as is, only their keys are interned. `name` is left out, it is also
+# the unique name of each asset.
+VOCABULARY_KEYS = frozenset({
+    '@context', 'type', 'contractName', 'functionName', 'eventName', 'moduleName',
+    'version', 'actorType', 'serviceEndpoint', 'templateId', 'license', 'contentType',
+    'encoding', 'compression', 'checksumType', 'inLanguage', 'fulfillmentOrder', 'dependencies',
+    'categories', 'tags',
+})
+
+_enabled = False
+
+
+def enable_interning():
+    """Intern the strings of the DDOs parsed from now on."""
+    global _enabled
+    _enabled = True
+
+
+def disable_interning():
+    """Stop interning the strings of the DDOs parsed from now on."""
+    global _enabled
+    _enabled = False
+
+
+def is_interning_enabled():
+    return _enabled
+
+
+def intern_string(value):
+    """Return the shared instance of `value` if interning is enabled and it is a str."""
+    if _enabled and type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+def _intern(value, is_vocabulary):
+    if isinstance(value, Mapping):
+        return {
+            sys.intern(k) if type(k) is str else k: _intern(v, k in VOCABULARY_KEYS)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_intern(v, is_vocabulary) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_intern(v, is_vocabulary) for v in value)
+    if type(value) is str:
+        return sys.intern(value) if is_vocabulary else value
+    if value is None or type(value) in (int, float, bool):
+        return value
+    # not a plain JSON value, copied like when interning is disabled.
+    return copy.deepcopy(value)
+
+
+def intern_json(value):
+    """
+    Return a copy of a JSON value with its dict keys and vocabulary values interned, or the
+    value itself if interning is disabled. Mappings are copied to dicts.
+    """
+    if not _enabled:
+        return value
+    return _intern(value, False)
@@ -0,0 +1,173 @@
+"""Refresh-ahead cache for resolved DDOs."""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from ocean_utils.utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshAheadCache:
+    """
+    TTL cache that revalidates entries in the background before they expire.
+
+    An entry older than `ttl * refresh_ahead` is served as is and reloaded on a background
+    thread. An entry older than `ttl` is stale, it is still served while being revalidated
+    for up to `max_stale` more seconds, after which it is reloaded synchronously. A hot key
+    therefore never waits on a load once it is cached. Loading errors are logged and the
+    previous value is kept, errors are never cached.
+
+    Values are returned as is to every caller, cache immutable values (like `FrozenDDO`).
+    Loads that started before `invalidate` or `clear` do not store their value.
+    """
+
+    def __init__(self, ttl, refresh_ahead=0.8, max_stale=None, max_size=10000, max_workers=2,
+                 clock=time.monotonic):
+        """
+
+        :param ttl: float seconds an entry is considered fresh.
+        :param refresh_ahead: float fraction of `ttl` after which an entry is refreshed.
+        :param max_stale: float seconds past `ttl` a stale entry can be served, defaults to `ttl`.
+        :param max_size: int max number of entries, least recently used ones are evicted.
+        :param max_workers: int number of background refresh threads.
+        :param clock: callable returning the current time in seconds.
+        """
+        assert ttl > 0, f'Invalid ttl {ttl}, must be > 0.'
+        assert 0 < refresh_ahead <= 1, f'Invalid refresh_ahead {refresh_ahead}, must be in (0, 1].'
+        self._ttl = ttl
+        self._refresh_after = ttl * refresh_ahead
+        self._expire_after = ttl + (ttl if max_stale is None else max_stale)
+        self._max_size = max_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        # invalidation count of each key since the last clear, see `generation`.
+        self._generations = {}
+        self._epoch = 0
+        self._single_flight = SingleFlight()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._closed = False
+
+    def get(self, key, loader, *args):
+        """
+        Return the cached value of `key`, calling `loader(*args)` to load it if needed.
+
+        :param key: hashable cache key
+        :param loader: callable returning the value of `key`
+        :return: the cached or loaded value
+        """
+        found, value = self.lookup(key, loader, *args)
+        if found:
+            return value
+        return self._load(key, loader, *args)
+
+    def lookup(self, key, loader, *args):
+        """
+        Return the cached value of `key` without loading it, the value is refreshed in the
+        background like in `get` when it is getting old.
+
+        :param key: hashable cache key
+        :param loader: callable returning the value of `key`
+        :return: tuple (found, value), found is False if `key` is not cached or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None:
+            return False, None
+
+        value, loaded_at = entry
+        age = self._clock() - loaded_at
+        if age >= self._expire_after:
+            return False, None
+        if age >= self._refresh_after:
+            self._refresh_in_background(key, loader, *args)
+        return True, value
+
+    def generation(self, key):
+        """
+        Return the generation of `key`, it changes when `key` is invalidated or the cache is
+        cleared. Read it before loading a value to pass to `put`.
+        """
+        with self._lock:
+            return self._epoch, self._generations.get(key, 0)
+
+    def put(self, key, value, generation=None):
+        """
+        Store the value of `key`.
+
+        :param key: hashable cache key
+        :param value: the value
+        :param generation: the `generation` of `key` read before loading the value, the
+            value is not stored if `key` was invalidated since.
+        :return: bool True if the value was stored
+        """
+        with self._lock:
+            if generation is not None and generation != (
+                    self._epoch, self._generations.get(key, 0)):
+                return False
+            self._entries[key] = (value, self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return True
+
+    def invalidate(self, key):
+        """Remove `key` from the cache, loads of `key` in progress will not be stored."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self):
+        """Remove all the entries, loads in progress will not be stored."""
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._epoch += 1
+
+    def close(self):
+        """
+        Wait for the background refreshes to finish and stop the refresh threads. The cache can
+        still be used, entries are no longer refreshed ahead of their expiry and expired ones
+        are loaded synchronously.
+        """
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _load(self, key, loader, *args):
+        generation = self.generation(key)
+        # loads started after an invalidation do not join the ones started before.
+        value = self._single_flight.do((key, generation), loader, *args)
+        self.put(key, value, generation)
+        return value
+
+    def _refresh_in_background(self, key, loader, *args):
+        with self._lock:
+            if self._closed or key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            # submitted under the lock so that `close` cannot shut the executor down in between.
+            self._executor.submit(self._refresh, key, loader, *args)
+
+    def _refresh(self, key, loader, *args):
+        try:
+            self._load(key, loader, *args)
+        except Exception as e:
+            logger.warning(f'Refreshing cache entry {key} failed, keeping the stale value: {e}')
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
@@ -0,0 +1,94 @@
+"""Deduplication of concurrent calls sharing the same key."""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import threading
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Make sure only one call is in flight for a given key at a time.
+
+    Threads calling `do` with a key that is already being computed wait for the running
+    call and get its result (or its exception) instead of running the function again.
+    Results are not kept once the call completes, this is not a cache.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, function, *args, **kwargs):
+        """
+        Run `function(*args, **kwargs)` unless a call for `key` is already in flight.
+
+        :param key: hashable identifier of the call
+        :param function: callable to run
+        :return: the result of the call, shared by all the concurrent callers
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not is_leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function(*args, **kwargs)
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+
+class AsyncSingleFlight:
+    """
+    Asyncio version of `SingleFlight`, for coroutines running on the same event loop.
+
+    The shared call runs in its own task, cancelling one of the waiters does not cancel it
+    for the others.
+    """
+
+    def __init__(self):
+        self._futures = {}
+
+    async def do(self, key, coroutine_function, *args, **kwargs):
+        """
+        Await `coroutine_function(*args, **kwargs)` unless a call for `key` is already in flight.
+
+        :param key: hashable identifier of the call
+        :param coroutine_function: coroutine function to run
+        :return: the result of the call, shared by all the concurrent callers
+        """
+        future = self._futures.get(key)
+        if future is None:
+            future = asyncio.ensure_future(coroutine_function(*args, **kwargs))
+            self._futures[key] = future
+            future.add_done_callback(lambda f: self._forget(key, f))
+
+        return await asyncio.shield(future)
+
+    def _forget(self, key, future):
+        if self._futures.get(key) is future:
+            del self._futures[key]
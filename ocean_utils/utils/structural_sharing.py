@@ -0,0 +1,57 @@
+"""Sharing of identical JSON trees between objects."""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import copy
+import hashlib
+import json
+import threading
+import weakref
+
+from ocean_utils.ddo.frozen import freeze_value
+
+
+class SharedTree:
+    """
+    Holder of a JSON tree shared by all the owners of a tree with the same content, the tree
+    is deeply immutable, see `freeze_value`.
+    """
+    __slots__ = ('value', '__weakref__')
+
+    def __init__(self, value):
+        self.value = value
+
+
+_trees = weakref.WeakValueDictionary()
+_lock = threading.Lock()
+
+
+def share_tree(value):
+    """
+    Return the SharedTree holding a frozen copy of `value`.
+
+    Trees are identified by their JSON text, so values with the same content get the same
+    SharedTree as long as one of them is referenced. The shared value is read-only, owners
+    that need to change it must thaw it first, see `thaw_value`. Values that can not be
+    converted to JSON are frozen but not shared.
+
+    :param value: JSON value, not changed.
+    :return: SharedTree
+    """
+    try:
+        key = hashlib.sha256(json.dumps(value).encode('utf-8')).digest()
+    except (TypeError, ValueError):
+        return SharedTree(freeze_value(copy.deepcopy(value)))
+
+    with _lock:
+        tree = _trees.get(key)
+        if tree is None:
+            tree = SharedTree(freeze_value(value))
+            _trees[key] = tree
+    return tree
+
+
+def shared_tree_count():
+    """Number of distinct trees currently shared."""
+    return len(_trees)
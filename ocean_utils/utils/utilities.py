@@ -4,9 +4,11 @@
 
 import hashlib
 import json
-import uuid
+import os
 from datetime import datetime
 
+ID_BYTES_LENGTH = 32
+
 
 def generate_new_id():
     """
@@ -14,7 +16,29 @@ def generate_new_id():
 
     :return: Id, str
     """
-    return uuid.uuid4().hex + uuid.uuid4().hex
+    return os.urandom(ID_BYTES_LENGTH).hex()
+
+
+def generate_id_bytes(count):
+    """
+    Generate `count` new ids from a single read of the OS random source.
+
+    :param count: int number of ids
+    :return: bytes of length 32 * count, the ids packed one after the other
+    """
+    return os.urandom(ID_BYTES_LENGTH * count)
+
+
+def generate_new_ids(count):
+    """
+    Generate `count` new ids without prefix.
+
+    :param count: int number of ids
+    :return: list of Id, str
+    """
+    ids = generate_id_bytes(count).hex()
+    size = 2 * ID_BYTES_LENGTH
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
 
 
 def generate_prefixed_id():
@@ -26,6 +50,16 @@ def generate_prefixed_id():
     return f'0x{generate_new_id()}'
 
 
+def generate_prefixed_ids(count):
+    """
+    Generate `count` new ids prefixed with 0x, see `generate_prefixed_id`.
+
+    :param count: int number of ids
+    :return: list of Id, str
+    """
+    return ['0x' + _id for _id in generate_new_ids(count)]
+
+
 def to_32byte_hex(web3, val):
     """
 
@@ -66,11 +100,58 @@ def convert_to_text(web3, data):
     return web3.toText(data)
 
 
-def checksum(seed):
-    """Calculate the hash3_256."""
-    return hashlib.sha3_256(
-        (json.dumps(dict(sorted(seed.items(), reverse=False))).replace(" ", "")).encode(
-            'utf-8')).hexdigest()
+_COMPACT_SEPARATORS = (',', ':')
+# reused encoders, json.dumps builds a new encoder on every call with non default options.
+_COMPACT_ENCODER = json.JSONEncoder(separators=_COMPACT_SEPARATORS)
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=_COMPACT_SEPARATORS)
+
+
+def _json_key(key):
+    """Convert a dict key to str the way json.dumps does."""
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return 'true'
+    if key is False:
+        return 'false'
+    if key is None:
+        return 'null'
+    if isinstance(key, float):
+        return json.dumps(key)
+    if isinstance(key, int):
+        return int.__repr__(key)
+    raise TypeError(f'keys must be str, int, float, bool or None, not {type(key).__name__}')
+
+
+def checksum(seed, legacy=True):
+    """
+    Calculate the hash3_256 of a dict.
+
+    :param seed: dict
+    :param legacy: bool hash the JSON text with the top-level keys sorted and all the spaces
+        removed, as used by the existing DIDs and proofs. Otherwise hash the canonical
+        JSON text, keys sorted at all levels, compact separators and values unchanged.
+    :return: hex str
+    """
+    if legacy:
+        # the spaces inside values are removed as well, kept for the existing DIDs.
+        text = _COMPACT_ENCODER.encode(dict(sorted(seed.items()))).replace(' ', '')
+    else:
+        if not all(isinstance(key, str) for key in seed):
+            seed = {_json_key(key): value for key, value in seed.items()}
+        text = _CANONICAL_ENCODER.encode(seed)
+    return hashlib.sha3_256(text.encode('utf-8')).hexdigest()
+
+
+def checksum_many(seeds, legacy=True):
+    """
+    Calculate the checksum of many dicts, see `checksum`.
+
+    :param seeds: iterable of dict
+    :param legacy: bool
+    :return: list of hex str
+    """
+    return [checksum(seed, legacy) for seed in seeds]
 
 
 def get_timestamp():
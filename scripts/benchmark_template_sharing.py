@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+"""
+Memory used by a synthetic catalog of DDOs with shared agreement templates, and once every
+template has been copied.
+
+    python scripts/benchmark_template_sharing.py [count]
+"""
+
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+from ocean_utils.agreements.service_types import ServiceTypes
+from ocean_utils.ddo.ddo import DDO
+from ocean_utils.did import DID
+
+SAMPLE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'resources', 'ddo',
+    'ddo_sa_sample.json')
+
+
+def make_catalog(json_text, count):
+    ddos = []
+    for i in range(count):
+        ddo_dict = json.loads(json_text)
+        ddo_dict['id'] = DID.did({"0": f"0x{i}"})
+        ddos.append(DDO(dictionary=ddo_dict))
+    return ddos
+
+
+def main(count):
+    with open(SAMPLE_PATH) as f:
+        json_text = f.read()
+
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    ddos = make_catalog(json_text, count)
+    gc.collect()
+    shared = tracemalloc.get_traced_memory()[0] - start
+    for ddo in ddos:
+        # the mutable template is a copy of the shared one
+        assert ddo.get_service(ServiceTypes.ASSET_ACCESS).service_agreement_template.template
+    gc.collect()
+    copied = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    print(f'{count} DDOs')
+    print(f'shared templates: {shared / 1024:10.1f} KiB, {shared / count:8.0f} B/DDO')
+    print(f'copied templates: {copied / 1024:10.1f} KiB, {copied / count:8.0f} B/DDO')
+    print(f'saved: {1 - shared / copied:.1%}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
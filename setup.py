@@ -33,6 +33,8 @@ test_requirements = [
     'coverage',
     'docker',
     'mccabe',
+    'msgpack>=1.0',
+    'numpy',
     'pylint',
     'pytest',
     'pytest-watch',
@@ -52,6 +54,27 @@ docs_requirements = [
     'sphinxcontrib-apidoc',
 ]
 
+# Optional, used by AsyncAquarius:
+async_requirements = [
+    'aiohttp',
+]
+
+# Optional, used by the columnar export of DDOs:
+analytics_requirements = [
+    'numpy',
+    'pyarrow',
+]
+
+# Optional, used to read and write .zst NDJSON files of DDOs:
+compression_requirements = [
+    'zstandard',
+]
+
+# Optional, used by the binary encoding of DDOs:
+binary_requirements = [
+    'msgpack>=1.0',
+]
+
 packages = []
 for d, _, _ in os.walk('ocean_utils'):
     if os.path.exists(join(d, '__init__.py')):
@@ -67,8 +90,17 @@ setup(
         'Natural Language :: English',
         'Programming Language :: Python :: 3.6',
     ],
+    entry_points={
+        'console_scripts': [
+            'ocean-aquarius-backup=ocean_utils.aquarius.backup:main',
+        ],
+    },
     description="🐳 Library including all the common functionalities used in Python projects",
     extras_require={
+        'analytics': analytics_requirements,
+        'async': async_requirements,
+        'binary': binary_requirements,
+        'compression': compression_requirements,
         'test': test_requirements,
         'dev': dev_requirements + test_requirements + docs_requirements,
         'docs': docs_requirements,
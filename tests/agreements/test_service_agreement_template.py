@@ -0,0 +1,74 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import copy
+import json
+import pickle
+
+from ocean_utils.agreements.service_types import ServiceTypes
+from tests.resources.helper_functions import get_ddo_samples
+
+
+def _template(ddo):
+    return ddo.get_service(ServiceTypes.ASSET_ACCESS).service_agreement_template
+
+
+def test_template_sharing():
+    first, second, third = get_ddo_samples(3)
+    assert _template(first).is_shared
+    assert _template(first)._shared_tree is _template(second)._shared_tree
+    assert first.as_dictionary()['service'][1] == second.as_dictionary()['service'][1]
+
+    # changes copy the template first
+    conditions = _template(first).conditions
+    conditions[0].timeout = 3600
+    _template(first).set_conditions(conditions)
+    assert not _template(first).is_shared
+    assert _template(first).conditions[0].timeout == 3600
+    assert _template(second).conditions[0].timeout == 0
+
+    _template(second).template['contractName'] = 'OtherTemplate'
+    assert _template(second).contract_name == 'OtherTemplate'
+    assert _template(third).contract_name != 'OtherTemplate'
+    assert _template(third).is_shared
+
+    access = json.loads(third.as_text())['service'][1]
+    template_json = access['attributes']['serviceAgreementTemplate']
+    assert template_json['contractName'] == _template(third).contract_name
+
+
+def test_shared_template_is_not_exposed():
+    first, second, third = get_ddo_samples(3)
+    data = first.as_dictionary()
+    data['service'][1]['attributes']['serviceAgreementTemplate']['contractName'] = 'Changed'
+    data['service'][1]['attributes']['serviceAgreementTemplate']['conditions'][0]['timeout'] = 9
+    assert _template(first).contract_name != 'Changed'
+    assert _template(second).contract_name != 'Changed'
+    assert _template(second).conditions[0].timeout == 0
+    assert first.as_dictionary()['service'] == second.as_dictionary()['service']
+
+    # the attributes hold the template dict of the service, a plain dict.
+    access = second.get_service(ServiceTypes.ASSET_ACCESS)
+    attributes = access.attributes
+    assert attributes['serviceAgreementTemplate'] is _template(second).template
+    assert not _template(second).is_shared and _template(third).is_shared
+    assert json.loads(json.dumps(attributes)) == copy.deepcopy(attributes)
+    attributes['serviceAgreementTemplate']['conditions'][0]['timeout'] = 999
+    assert _template(second).conditions[0].timeout == 999
+    _template(second).set_conditions(_template(second).conditions[:1])
+    assert len(access.attributes['serviceAgreementTemplate']['conditions']) == 1
+
+    # the getters return the values of the template, their changes are kept.
+    _template(third).fulfillment_order.append('changed')
+    assert _template(third).fulfillment_order[-1] == 'changed'
+    _template(third).condition_dependency['changed'] = []
+    assert 'changed' in _template(third).condition_dependency
+    assert not _template(third).is_shared
+    template_json = _template(first).as_dictionary()['serviceAgreementTemplate']
+    assert 'changed' not in template_json['fulfillmentOrder'] and _template(first).is_shared
+    assert _template(get_ddo_samples(1)[0]).as_dictionary() == _template(first).as_dictionary()
+
+    for restored in (pickle.loads(pickle.dumps(first)), copy.deepcopy(first)):
+        assert _template(restored).is_shared
+        assert _template(restored)._shared_tree is _template(first)._shared_tree
+        assert restored.as_dictionary() == first.as_dictionary()
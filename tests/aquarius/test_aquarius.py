@@ -0,0 +1,63 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import json
+from collections import namedtuple
+
+from ocean_utils.aquarius.aquarius import Aquarius
+from tests.resources.helper_functions import get_ddo_sample
+
+_Response = namedtuple('_Response', ('status_code', 'content'))
+
+
+class _Session:
+    def __init__(self, patch_status_code):
+        self.patch_status_code = patch_status_code
+        self.requests = []
+
+    def patch(self, url, data, headers):
+        self.requests.append(('patch', json.loads(data)))
+        return _Response(self.patch_status_code, b'{}')
+
+    def put(self, url, data, headers):
+        self.requests.append(('put', json.loads(data)))
+        return _Response(200, data)
+
+
+def _update(aquarius):
+    ddo = get_ddo_sample()
+    changed = get_ddo_sample()
+    changed.metadata['curation']['rating'] = 0.8
+    return aquarius.update_asset_ddo(ddo.did, changed, previous_ddo=ddo)
+
+
+def test_update_asset_ddo_with_patch():
+    aquarius = Aquarius('http://localhost:5000')
+    aquarius.requests_session = _Session(200)
+    _update(aquarius)
+    ddo = get_ddo_sample()
+    assert aquarius.requests_session.requests == [
+        ('patch', [
+            {'op': 'test', 'path': '/id', 'value': ddo.did},
+            {'op': 'test', 'path': '/service/0/type', 'value': 'metadata'},
+            {'op': 'test', 'path': '/service/0/index', 'value': 0},
+            {'op': 'replace', 'path': '/service/0/attributes/curation/rating', 'value': 0.8},
+        ])
+    ]
+
+    ddo = get_ddo_sample()
+    assert aquarius.update_asset_ddo(ddo.did, ddo, previous_ddo=ddo) == ddo.as_dictionary()
+    assert len(aquarius.requests_session.requests) == 1, 'no request for unchanged ddos.'
+
+
+def test_update_asset_ddo_patch_fallback():
+    aquarius = Aquarius('http://localhost:5000')
+    aquarius.requests_session = _Session(405)
+    response = _update(aquarius)
+    assert response['service'][0]['attributes']['curation']['rating'] == 0.8
+    assert [method for method, _ in aquarius.requests_session.requests] == ['patch', 'put']
+
+    # patches are not tried again once rejected
+    _update(aquarius)
+    assert [method for method, _ in aquarius.requests_session.requests] == \
+        ['patch', 'put', 'put']
@@ -0,0 +1,58 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import math
+
+from ocean_utils.aquarius import backup
+from ocean_utils.aquarius.backup import backup_aquarius, restore_aquarius
+from ocean_utils.ddo.ndjson import read_ddo_dicts
+from tests.resources.helper_functions import get_ddo_sample_dicts
+
+
+class _Aquarius:
+    def __init__(self, ddo_dicts=()):
+        self.ddos = {ddo_dict['id']: ddo_dict for ddo_dict in ddo_dicts}
+
+    def list_assets_ddo(self):
+        return list(self.ddos.values())
+
+    def query_search(self, search_query, sort=None, offset=100, page=1):
+        results = list(self.ddos.values())
+        return {
+            'results': results[(page - 1) * offset:page * offset],
+            'page': page,
+            'total_pages': math.ceil(len(results) / offset),
+            'total_results': len(results)
+        }
+
+    def publish_asset_ddo(self, ddo):
+        if ddo.did in self.ddos:
+            raise ValueError('This Asset ID already exists!')
+        self.ddos[ddo.did] = ddo.as_dictionary()
+        return self.ddos[ddo.did]
+
+
+def test_backup_and_restore(tmp_path):
+    source = _Aquarius(get_ddo_sample_dicts(7))
+    path = tmp_path / 'backup.ndjson.gz'
+    assert backup_aquarius(source, path) == 7
+    assert backup_aquarius(source, tmp_path / 'search.ndjson', use_search=True, page_size=3) == 7
+    assert list(read_ddo_dicts(tmp_path / 'search.ndjson')) == list(read_ddo_dicts(path))
+
+    existing = get_ddo_sample_dicts(1)[0]
+    target = _Aquarius([existing])
+    result = restore_aquarius(target, path, publish_workers=2)
+    assert result.published == 6
+    assert result.failed == [(existing['id'], 'This Asset ID already exists!')]
+    assert set(target.ddos) == set(source.ddos)
+
+
+def test_backup_cli(tmp_path, monkeypatch):
+    aquarius = _Aquarius(get_ddo_sample_dicts(3))
+    monkeypatch.setattr(backup, 'Aquarius', lambda url: aquarius)
+    path = str(tmp_path / 'backup.ndjson')
+
+    assert backup.main(['backup', 'http://localhost:5000', path, '--search']) == 0
+    assert len(list(read_ddo_dicts(path))) == 3
+    assert backup.main(['restore', 'http://localhost:5000', path]) == 1, \
+        'all the ddos already exist.'
@@ -0,0 +1,61 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import math
+
+from ocean_utils.aquarius.catalog_sync import CatalogMirrorStore, CatalogSync
+from ocean_utils.did import DID
+
+
+class _SearchAquarius:
+    def __init__(self):
+        self.ddos = {}
+        self.queries = []
+
+    def publish(self, i, created, updated=None):
+        did = DID.did({"0": f"0x{i}"})
+        self.ddos[did] = {'id': did, 'created': created, 'updated': updated or created}
+
+    def list_assets(self):
+        return list(self.ddos)
+
+    def query_search(self, search_query, sort=None, offset=100, page=1):
+        self.queries.append((search_query, page))
+        (field, (since, until)), = search_query['query'].items()
+        matches = sorted(
+            (d for d in self.ddos.values() if since <= d[field] <= until),
+            key=lambda d: d[field]
+        )
+        return {
+            'results': matches[(page - 1) * offset:page * offset],
+            'page': page,
+            'total_pages': max(1, math.ceil(len(matches) / offset)),
+            'total_results': len(matches)
+        }
+
+
+def test_catalog_sync():
+    aquarius = _SearchAquarius()
+    for i in range(5):
+        aquarius.publish(i, f'2019-10-0{i + 1}T00:00:00Z')
+
+    store = CatalogMirrorStore(':memory:')
+    catalog_sync = CatalogSync(aquarius, store, page_size=2)
+    assert catalog_sync.sync().upserted == 10
+    assert store.count() == 5
+    assert store.get_checkpoint('created') == '2019-10-05T00:00:00Z'
+
+    # only the changes since the checkpoints are fetched
+    aquarius.publish(5, '2019-10-06T00:00:00Z')
+    aquarius.ddos[DID.did({"0": "0x0"})]['updated'] = '2019-10-07T00:00:00Z'
+    retired_did = DID.did({"0": "0x1"})
+    del aquarius.ddos[retired_did]
+
+    result = catalog_sync.sync()
+    assert result.retired == 1
+    assert result.upserted == 5, 'boundary and changed ddos only.'
+    assert store.count() == 5
+    assert store.get_ddo(retired_did) is None
+    ddo = store.get_ddo(DID.did({"0": "0x0"}))
+    assert ddo.did == DID.did({"0": "0x0"})
+    assert ddo.as_dictionary()['updated'] == '2019-10-07T00:00:00Z'
@@ -0,0 +1,59 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+from collections import namedtuple
+
+from ocean_utils.aquarius.aquarius import Aquarius
+from ocean_utils.aquarius.known_dids import KnownDIDs
+from ocean_utils.did import DID, did_to_id_bytes
+
+
+_Response = namedtuple('_Response', ('status_code', 'content'))
+
+
+class _Session:
+    def delete(self, url, headers):
+        return _Response(200, b'')
+
+
+class _ListingAquarius:
+    def __init__(self, dids):
+        self.dids = dids
+
+    def list_assets(self):
+        return self.dids
+
+
+def test_known_dids():
+    dids = [DID.did({"0": f"0x{i}"}) for i in range(20)]
+    known_dids = KnownDIDs.from_aquarius(_ListingAquarius(dids[:10]))
+    assert all(did in known_dids for did in dids[:10])
+    assert did_to_id_bytes(dids[0]) in known_dids, 'DID bytes should match the DID string.'
+    assert sum(did in known_dids for did in dids[10:]) <= 1
+    assert 'not a did' not in known_dids
+    assert None not in known_dids
+
+    known_dids.discard(dids[0])
+    assert dids[0] not in known_dids
+    known_dids.add(dids[10])
+    assert dids[10] in known_dids
+
+    known_dids.rebuild(dids[15:])
+    assert dids[1] not in known_dids and dids[15] in known_dids
+
+
+def test_aquarius_skips_unknown_dids():
+    did = DID.did({"0": "0x1"})
+    aquarius = Aquarius('http://localhost:5000', known_dids=KnownDIDs())
+    # no request is made for an unknown DID
+    assert aquarius.get_asset_ddo(did) == {}
+
+
+def test_retire_keeps_known_dids():
+    dids = [DID.did({"0": f"0x{i}"}) for i in range(10)]
+    known_dids = KnownDIDs.from_aquarius(_ListingAquarius(dids))
+    aquarius = Aquarius('http://localhost:5000', known_dids=known_dids)
+    aquarius.requests_session = _Session()
+    # the retired DID may never have been added, discarding it could hide the other DIDs.
+    aquarius.retire_asset_ddo(DID.did({"0": "0x100"}))
+    assert all(did in known_dids for did in dids)
@@ -0,0 +1,64 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from ocean_utils.aquarius.local_catalog import LocalCatalog
+from ocean_utils.ddo.ddo import DDO
+from tests.resources.helper_functions import get_ddo_sample_dicts
+
+
+def _make_ddos(count):
+    ddos = []
+    for i, ddo_dict in enumerate(get_ddo_sample_dicts(count, file_name='ddo_sample1.json')):
+        ddo_dict['created'] = f'2019-10-{i + 1:02d}T00:00:00Z'
+        attributes = ddo_dict['service'][0]['attributes']
+        attributes['main']['name'] = f'Weather dataset {i}' if i % 2 else f'Traffic counts {i}'
+        attributes['main']['price'] = str(i * 10)
+        attributes['main']['type'] = 'algorithm' if i == 3 else 'dataset'
+        attributes['additionalInformation']['tags'] = ['even' if i % 2 == 0 else 'odd']
+        ddos.append(DDO(dictionary=ddo_dict))
+    return ddos
+
+
+def test_local_catalog_query_search():
+    ddos = _make_ddos(10)
+    catalog = LocalCatalog(ddos)
+    assert len(catalog) == 10
+
+    result = catalog.query_search({'query': {'price': [20, 50]}})
+    assert result['total_results'] == 4
+    assert [d['id'] for d in result['results']] == [ddo.did for ddo in ddos[2:6]]
+
+    result = catalog.query_search({'query': {'tags': ['Odd'], 'price': [None, 50]}},
+                                  sort={'price': -1})
+    assert [d['id'] for d in result['results']] == [ddos[5].did, ddos[3].did, ddos[1].did]
+
+    result = catalog.query_search({'query': {'type': ['algorithm']}})
+    assert [d['id'] for d in result['results']] == [ddos[3].did]
+
+    result = catalog.query_search({'query': {}}, sort={'created': -1}, offset=3, page=2)
+    assert result['page'] == 2 and result['total_pages'] == 4 and result['total_results'] == 10
+    assert [d['id'] for d in result['results']] == [ddos[6].did, ddos[5].did, ddos[4].did]
+
+    with pytest.raises(ValueError):
+        catalog.query_search({'query': {'unknown': ['x']}})
+
+
+def test_local_catalog_text_search():
+    ddos = _make_ddos(6)
+    catalog = LocalCatalog(ddos)
+
+    result = catalog.text_search('weather dataset')
+    assert [d['id'] for d in result['results']] == [ddos[1].did, ddos[3].did, ddos[5].did]
+    # description words are indexed too
+    assert catalog.text_search('humidity')['total_results'] == 6
+    assert catalog.text_search('rainfall')['total_results'] == 0
+
+    assert catalog.remove(ddos[1].did)
+    assert not catalog.remove(ddos[1].did)
+    assert catalog.text_search('weather dataset')['total_results'] == 2
+    assert catalog.query_search({'query': {'price': [10, 10]}})['total_results'] == 0
+
+    catalog.add(ddos[1])
+    assert catalog.query_search({'query': {'price': [10, 10]}})['total_results'] == 1
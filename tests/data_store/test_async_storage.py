@@ -0,0 +1,51 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+import asyncio
+
+import pytest
+
+from ocean_utils.aquarius.catalog_sync import CatalogMirrorStore
+from ocean_utils.data_store.async_storage import AsyncStorage
+from ocean_utils.data_store.storage_base import StorageBase
+
+
+def test_async_storage_run_query():
+    loop = asyncio.new_event_loop()
+    store = AsyncStorage(StorageBase(':memory:', check_same_thread=False), max_pending=2, loop=loop)
+
+    async def _run():
+        await store.run_query('CREATE TABLE agreements (id VARCHAR PRIMARY KEY, did VARCHAR);')
+        await asyncio.gather(*[
+            store.run_query('INSERT INTO agreements VALUES (?,?)', (str(i), f'did:op:{i}'))
+            for i in range(10)
+        ])
+        rows = await store.run_query('SELECT did FROM agreements WHERE id=?', ('3',))
+        count = await store.run_query('SELECT count(*) FROM agreements')
+        await store.close()
+        return rows, count
+
+    rows, count = loop.run_until_complete(_run())
+    loop.close()
+    assert rows == [('did:op:3',)]
+    assert count == [(10,)]
+
+
+def test_async_storage_requires_shareable_memory_connection():
+    with pytest.raises(ValueError):
+        AsyncStorage(StorageBase(':memory:'))
+
+
+def test_async_storage_reconnects_on_worker_thread(tmp_path):
+    # the store creates its tables, and opens its connection, on this thread.
+    loop = asyncio.new_event_loop()
+    store = AsyncStorage(CatalogMirrorStore(str(tmp_path / 'mirror.db')), loop=loop)
+
+    async def _run():
+        await store.run_query('INSERT INTO sync_checkpoints VALUES (?,?)', ('aquarius', '1'))
+        rows = await store.run_query('SELECT value FROM sync_checkpoints')
+        await store.close()
+        return rows
+
+    rows = loop.run_until_complete(_run())
+    loop.close()
+    assert rows == [('1',)]
@@ -0,0 +1,91 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import os
+
+import pytest
+
+from ocean_utils.ddo.archive import (ENCODING_BINARY, ENCODING_JSON, DDOArchive,
+                                     DDOArchiveWriter, write_archive)
+from ocean_utils.did import DID
+from tests.resources.helper_functions import get_ddo_samples
+
+
+@pytest.mark.parametrize('encoding', [ENCODING_JSON, ENCODING_BINARY])
+def test_archive(tmp_path, encoding):
+    if encoding == ENCODING_BINARY:
+        pytest.importorskip('msgpack')
+    path = str(tmp_path / 'ddos.archive')
+    ddos = get_ddo_samples(50)
+    assert write_archive(path, ddos, encoding) == 50
+
+    with DDOArchive(path) as archive:
+        assert archive.encoding == encoding
+        assert len(archive) == 50
+        for ddo in ddos:
+            assert ddo.did in archive
+            assert archive.get_ddo(ddo.did).as_dictionary() == ddo.as_dictionary()
+        missing_did = DID.did({"0": "0x1000"})
+        assert missing_did not in archive
+        assert archive.get_ddo(missing_did) is None
+        assert [ddo.did for ddo in archive] == [ddo.did for ddo in ddos]
+
+
+def test_archive_append(tmp_path):
+    path = str(tmp_path / 'ddos.archive')
+    write_archive(path, get_ddo_samples(3))
+
+    size = os.path.getsize(path)
+    reader = DDOArchive(path)
+    updated = get_ddo_samples(1, 1)[0]
+    updated.metadata['main']['name'] = 'updated'
+    with DDOArchiveWriter(path, append=True) as writer:
+        writer.write_many(get_ddo_samples(2, 3))
+        writer.write(updated)
+    assert writer.count == 5
+    assert os.path.getsize(path) > size, 'appending must not shorten the file.'
+    # a reader opened before the append still sees the previous content.
+    assert len(reader) == 3 and reader.get_ddo(updated.did).metadata['main']['name'] != 'updated'
+    reader.close()
+
+    with DDOArchive(path) as archive:
+        assert len(archive) == 5
+        assert archive.get_ddo(updated.did).metadata['main']['name'] == 'updated'
+        assert [ddo.did for ddo in archive] == [DID.did({"0": f"0x{i}"}) for i in (0, 2, 3, 4, 1)]
+
+
+def test_archive_interrupted_append(tmp_path):
+    path = str(tmp_path / 'ddos.archive')
+    write_archive(path, get_ddo_samples(3))
+
+    # the process dies after writing some records, before the index and trailer.
+    writer = DDOArchiveWriter(path, append=True)
+    writer.write_many(get_ddo_samples(2, 3))
+    writer._file.close()
+    with DDOArchive(path) as archive:
+        assert len(archive) == 3 and DID.did({"0": "0x3"}) not in archive
+
+    with DDOArchiveWriter(path, append=True) as writer:
+        writer.write_many(get_ddo_samples(1, 5))
+    with DDOArchive(path) as archive:
+        assert len(archive) == 4 and DID.did({"0": "0x5"}) in archive
+
+    # the process dies while writing the trailer.
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) - 5)
+    with DDOArchive(path) as archive:
+        assert len(archive) == 3
+        assert [ddo.did for ddo in archive] == [DID.did({"0": f"0x{i}"}) for i in range(3)]
+
+
+def test_archive_empty_and_invalid(tmp_path):
+    path = str(tmp_path / 'empty.archive')
+    write_archive(path, [])
+    with DDOArchive(path) as archive:
+        assert len(archive) == 0
+        assert archive.get_ddo(DID.did({"0": "0x1"})) is None
+
+    invalid_path = tmp_path / 'invalid.archive'
+    invalid_path.write_bytes(b'{"id": "did:op:1"}' * 4)
+    with pytest.raises(ValueError):
+        DDOArchive(str(invalid_path))
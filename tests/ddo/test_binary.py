@@ -0,0 +1,41 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import pytest
+
+from ocean_utils.ddo.binary import WELL_KNOWN_KEYS, decode_ddo_dict, encode_ddo_dict
+from ocean_utils.ddo.ddo import DDO
+from tests.resources.helper_functions import get_resource_path
+
+pytest.importorskip('msgpack')
+
+
+@pytest.mark.parametrize('name', ['ddo_sa_sample.json', 'ddo_sample1.json', 'ddo_sample2.json'])
+def test_ddo_as_bytes(name):
+    ddo = DDO(json_filename=get_resource_path('ddo', name))
+    data = ddo.as_bytes()
+    assert isinstance(data, bytes)
+    assert len(data) < len(ddo.as_text())
+
+    copied = DDO.from_bytes(data)
+    assert copied.as_dictionary() == ddo.as_dictionary()
+    assert copied.did == ddo.did
+    assert copied.asset_id == ddo.asset_id
+    assert [s.type for s in copied.services] == [s.type for s in ddo.services]
+    assert 'proof' not in DDO.from_bytes(ddo.as_bytes(is_proof=False)).as_dictionary()
+
+
+def test_binary_keys():
+    assert len(set(WELL_KNOWN_KEYS)) == len(WELL_KNOWN_KEYS)
+    value = {
+        'serviceEndpoint': 'http://localhost',
+        'unknown': [{'attributes': {'0': 1.5, '': None}}, b'\x00', True],
+        'nested': {'conditions': [], 'parameters': {'value': 'x' * 100}}
+    }
+    assert decode_ddo_dict(encode_ddo_dict(value)) == value
+    assert len(encode_ddo_dict({'serviceEndpoint': 1})) < len(json.dumps({'serviceEndpoint': 1}))
+
+    with pytest.raises(ValueError):
+        decode_ddo_dict(b'\xff' + encode_ddo_dict(value)[1:])
@@ -0,0 +1,38 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import pytest
+
+from ocean_utils.ddo.bulk import parse_ddos
+from ocean_utils.did import DID
+from tests.resources.helper_functions import get_ddo_sample_dicts
+
+
+def _make_items(count):
+    items = []
+    for i, ddo_dict in enumerate(get_ddo_sample_dicts(count)):
+        if i % 10 == 3:
+            del ddo_dict['service'][0]['attributes']['main']['license']
+        items.append(json.dumps(ddo_dict).encode() if i % 2 else ddo_dict)
+    items[5] = b'{"id": '
+    return items
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_parse_ddos(workers):
+    items = _make_items(40)
+    results = list(parse_ddos(iter(items), workers=workers, chunk_size=3))
+    assert len(results) == 40
+    for i, result in enumerate(results):
+        if i == 5:
+            assert result.ddo is None and not result.valid
+            assert result.error.startswith('JSONDecodeError')
+            continue
+        assert result.error is None
+        assert result.ddo.did == DID.did({"0": f"0x{i}"})
+        assert result.valid == (i % 10 != 3)
+
+    results = list(parse_ddos(items[:4], workers=workers, validate=False))
+    assert [r.valid for r in results] == [None] * 4
@@ -0,0 +1,66 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from ocean_utils.agreements.service_types import ServiceTypes
+from ocean_utils.ddo.columnar import ddos_to_columns, write_parquet
+from ocean_utils.ddo.ddo import DDO
+from ocean_utils.did import DID
+from tests.resources.helper_functions import get_ddo_sample_dicts
+
+numpy = pytest.importorskip('numpy')
+
+
+def _make_ddos():
+    ddo_dicts = get_ddo_sample_dicts(4)
+    for i, ddo_dict in enumerate(ddo_dicts[:3]):
+        main = ddo_dict['service'][0]['attributes']['main']
+        main['price'] = str(i * 10)
+        ddo_dict['service'][1]['attributes']['serviceAgreementTemplate']['conditions'][0][
+            'timeout'] = i
+
+    # no price, no access service
+    ddo_dict = ddo_dicts[3]
+    del ddo_dict['service'][0]['attributes']['main']['price']
+    ddo_dict['service'] = ddo_dict['service'][:1]
+    ddos = [DDO(dictionary=ddo_dict) for ddo_dict in ddo_dicts]
+    return ddos
+
+
+def test_ddos_to_columns():
+    ddos = _make_ddos()
+    columns = ddos_to_columns(iter(ddos))
+    assert all(len(column) == 4 for column in columns.values())
+    assert list(columns['did']) == [ddo.did for ddo in ddos]
+    assert list(columns['publisher']) == [ddo.publisher for ddo in ddos]
+    assert columns['price'].dtype == numpy.float64
+    assert numpy.array_equal(columns['price'][:3], [0., 10., 20.])
+    assert numpy.isnan(columns['price'][3])
+    assert numpy.nansum(columns['price']) == 30.
+    assert columns['created'].dtype == numpy.dtype('datetime64[s]')
+    assert columns['created'][0] == numpy.datetime64('2019-02-08T08:13:49')
+    assert columns['dateCreated'][0] == numpy.datetime64('2019-02-08T08:13:49')
+    assert list(columns['name']) == ['UK Weather information 2011'] * 4
+    assert list(columns['file_count']) == [1, 1, 1, 1]
+    assert columns['service_types'][0] == (ServiceTypes.METADATA, ServiceTypes.ASSET_ACCESS)
+    assert columns['service_types'][3] == (ServiceTypes.METADATA,)
+
+    condition = ddos[0].get_service(ServiceTypes.ASSET_ACCESS).conditions[0].name
+    timeouts = columns[f'{ServiceTypes.ASSET_ACCESS}.{condition}.timeout']
+    assert list(timeouts) == [0, 1, 2, -1]
+
+
+def test_ddos_to_columns_empty():
+    columns = ddos_to_columns([])
+    assert len(columns['did']) == 0
+    assert columns['price'].dtype == numpy.float64
+
+
+def test_write_parquet(tmp_path):
+    pyarrow_parquet = pytest.importorskip('pyarrow.parquet')
+    path = str(tmp_path / 'catalog.parquet')
+    write_parquet(ddos_to_columns(_make_ddos()), path)
+    table = pyarrow_parquet.read_table(path)
+    assert table.num_rows == 4
+    assert table.column('did').to_pylist()[0] == DID.did({"0": "0x0"})
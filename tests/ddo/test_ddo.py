@@ -5,6 +5,7 @@
 #  SPDX-License-Identifier: Apache-2.0
 
 import json
+from collections import OrderedDict, namedtuple
 
 import pytest
 from ocean_keeper import Keeper
@@ -14,7 +15,8 @@ from ocean_utils.agreements.service_factory import ServiceDescriptor, ServiceFac
 from ocean_utils.ddo.ddo import DDO
 from ocean_utils.ddo.public_key_base import PublicKeyBase
 from ocean_utils.ddo.public_key_rsa import PUBLIC_KEY_TYPE_ETHEREUM_ECDSA, PUBLIC_KEY_TYPE_RSA
-from ocean_utils.did import DID, did_to_id_bytes
+from ocean_utils.did import DID, did_to_id, did_to_id_bytes
+from ocean_utils.utils.interning import disable_interning, enable_interning
 from ocean_utils.utils.utilities import checksum
 from tests.resources.helper_functions import (get_ddo_sample, get_publisher_account,
                                               get_resource_path)
@@ -195,3 +197,192 @@ def test_service_factory():
 
     assert isinstance(services[1], ServiceAgreement)
     assert isinstance(services[2], ServiceAgreement)
+
+
+@unit_test
+def test_ddo_asset_id():
+    ddo = DDO(dictionary=_get_sample_ddo('ddo_sample1.json'))
+    asset_id = '0x0c184915b07b44c888d468be85a9b28253e80070e5294b1aaed81c2f0264e429'
+    assert ddo.asset_id == asset_id
+    assert ddo.asset_id_bytes == did_to_id_bytes(ddo.did)
+
+    did = DID.did({"0": "0x123"})
+    ddo._did = did
+    assert ddo.asset_id == f'0x{did_to_id(did)}', 'asset_id must follow DID changes.'
+
+    ddo = DDO()
+    assert ddo.asset_id is None and ddo.asset_id_bytes is None
+    ddo.assign_did(did)
+    assert ddo.asset_id_bytes == did_to_id_bytes(did)
+
+    sample = _get_sample_ddo('ddo_sample1.json')
+    sample['id'] = 'urn:uuid:1234'
+    ddo = DDO(dictionary=sample)
+    assert ddo.did == 'urn:uuid:1234', 'DDOs with a non DID id must still load.'
+    with pytest.raises(ValueError):
+        ddo.asset_id
+
+
+@unit_test
+def test_services_view():
+    ddo = get_ddo_sample()
+    view = ddo.services_view
+    assert list(view) == ddo.services
+    assert len(view) == len(ddo.services)
+    assert view[0] is ddo.services[0]
+    with pytest.raises(TypeError):
+        view[0] = None
+
+    ddo.add_service(TEST_SERVICE_TYPE, TEST_SERVICE_URL, index=10)
+    ddo.add_service(TEST_SERVICE_TYPE, 'http://localhost:8006', index=11)
+    assert len(view) == len(ddo.services), 'view must reflect added services.'
+    assert ddo.get_service(TEST_SERVICE_TYPE).service_endpoint == TEST_SERVICE_URL
+    assert ddo.get_service_by_index(11).service_endpoint == 'http://localhost:8006'
+    assert ddo.get_service_by_index(12) is None
+    assert ddo.get_service(None) is None
+
+
+@unit_test
+def test_ddo_rendering():
+    ddo = get_ddo_sample()
+    main = ddo.metadata['main']
+    text = ddo.as_text()
+    assert json.loads(text) == ddo.as_dictionary()
+    assert ddo.as_text() is text, 'an unchanged DDO should not be rendered again.'
+    data = ddo.as_dictionary()
+    data['service'].pop()
+    data['service'][0]['attributes'].pop('main')
+    assert ddo.as_dictionary() == json.loads(text), 'returned dicts are copies.'
+
+    main['price'] = '1000'
+    assert ddo.as_text() is text, 'reading or changing values in place keeps the rendering.'
+    assert ddo.as_dictionary()['service'][0]['attributes']['main']['price'] == '1000'
+    ddo.invalidate()
+    assert json.loads(ddo.as_text())['service'][0]['attributes']['main']['price'] == '1000', \
+        'changes made in place must be rendered after invalidate.'
+
+    ddo.add_service(TEST_SERVICE_TYPE, TEST_SERVICE_URL)
+    assert json.loads(ddo.as_text())['service'][-1]['serviceEndpoint'] == TEST_SERVICE_URL
+
+    ddo.add_proof({}, namedtuple('Account', ('address',))('0x1234'))
+    assert json.loads(ddo.as_text())['proof']['creator'] == '0x1234'
+    assert 'proof' not in json.loads(ddo.as_text(is_proof=False))
+
+    service = ddo.get_service(ServiceTypes.ASSET_ACCESS)
+    text = ddo.as_text()
+    service.set_service_endpoint('http://localhost:9000')
+    assert ddo.as_text() != text
+    text = ddo.as_text()
+    conditions = service.conditions
+    conditions[0].timeout = 3600
+    service.service_agreement_template.set_conditions(conditions)
+    service.invalidate()
+    access = ddo.as_dictionary()['service'][1]
+    assert access['attributes']['serviceAgreementTemplate']['conditions'][0]['timeout'] == 3600
+    assert ddo.as_text() != text
+
+
+@unit_test
+def test_ddo_freeze():
+    ddo = get_ddo_sample()
+    frozen = ddo.freeze()
+    assert frozen.did == ddo.did
+    assert frozen.asset_id == ddo.asset_id
+    assert frozen.publisher == ddo.publisher
+    assert frozen.as_dictionary() == ddo.as_dictionary()
+    assert json.loads(frozen.as_text()) == ddo.as_dictionary()
+    assert frozen.thaw().as_dictionary() == ddo.as_dictionary()
+    assert frozen.services is frozen.services, 'services must not be copied.'
+    assert [s.type for s in frozen.services] == [s.type for s in ddo.services]
+
+    access = frozen.get_service(ServiceTypes.ASSET_ACCESS)
+    assert access is frozen.get_service_by_index(access.index)
+    assert access.conditions[0]['name'] == ddo.get_service(
+        ServiceTypes.ASSET_ACCESS).conditions[0].name
+    with pytest.raises(TypeError):
+        frozen.metadata['main']['name'] = 'new name'
+    with pytest.raises(TypeError):
+        access.conditions[0]['timeout'] = 1
+    with pytest.raises(AttributeError):
+        frozen.services = ()
+
+    assert hash(frozen) == hash(ddo.freeze())
+    assert frozen == ddo.freeze()
+    assert len({frozen, ddo.freeze()}) == 1
+    ddo.metadata['main']['name'] = 'new name'
+    assert frozen.metadata['main']['name'] != 'new name', 'snapshot must not follow the ddo.'
+    assert frozen != ddo.freeze()
+
+    # the DID is only parsed on access, like in DDO
+    frozen = DDO(dictionary=dict(ddo.as_dictionary(), id='urn:uuid:1234')).freeze()
+    assert frozen.did == 'urn:uuid:1234'
+    with pytest.raises(ValueError):
+        frozen.asset_id
+
+
+@unit_test
+def test_ddo_string_interning():
+    with open(get_resource_path('ddo', 'ddo_sa_sample.json')) as f:
+        json_text = f.read()
+
+    def _strings(ddo):
+        access = ddo.get_service(ServiceTypes.ASSET_ACCESS)
+        condition = access.conditions[0]
+        template = access.service_agreement_template.template
+        return [
+            access.type,
+            access.service_endpoint,
+            template['contractName'],
+            template['conditions'][0]['functionName'],
+            condition.name,
+            condition.parameters[0].name,
+            condition.events[0].values_dict['handler']['moduleName'],
+            list(ddo.as_dictionary()['service'][0]['attributes']['main'])[0],
+        ]
+
+    first, second = DDO(json_text=json_text), DDO(json_text=json_text)
+    assert any(a is not b for a, b in zip(_strings(first), _strings(second)))
+
+    enable_interning()
+    try:
+        first, second = DDO(json_text=json_text), DDO(json_text=json_text)
+    finally:
+        disable_interning()
+    assert all(a is b for a, b in zip(_strings(first), _strings(second)))
+    assert first.as_dictionary() == DDO(json_text=json_text).as_dictionary()
+
+    dictionary = OrderedDict(json.loads(json_text))
+    enable_interning()
+    try:
+        ddo = DDO(dictionary=dictionary)
+    finally:
+        disable_interning()
+    assert dictionary == json.loads(json_text), 'the caller dict must not be changed.'
+    assert ddo.as_dictionary() == first.as_dictionary()
+
+
+@unit_test
+def test_compute_checksums():
+    ddo = get_ddo_sample()
+    expected = {str(s.index): checksum(s.main) for s in ddo.services}
+    checksums = ddo.compute_checksums()
+    assert checksums == expected
+
+    # cached until the service changes, changes made in place need an invalidate.
+    main = ddo.metadata['main']
+    main['name'] = 'new name'
+    assert ddo.compute_checksums() == checksums
+    ddo.invalidate()
+    assert ddo.compute_checksums()['0'] == checksum(main) != checksums['0']
+
+    # a replaced service is hashed again
+    access = ddo.get_service(ServiceTypes.ASSET_ACCESS)
+    replaced = ServiceAgreement.from_json(access.as_dictionary())
+    replaced.main['price'] = '1'
+    ddo = DDO(dictionary=dict(ddo.as_dictionary(), service=[]))
+    ddo.add_service(replaced)
+    assert ddo.compute_checksums() == {str(replaced.index): checksum(replaced.main)}
+
+    account = namedtuple('Account', ('address',))('0x00Bd138aBD70e2F00903268F3Db08f2D25677C9e')
+    ddo.add_proof(None, account)
+    assert ddo.proof['checksum'] == ddo.compute_checksums()
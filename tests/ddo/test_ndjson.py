@@ -0,0 +1,41 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from ocean_utils.ddo.ndjson import NDJSONWriter, read_ddo_dicts, read_ddos, write_ddos
+from tests.resources.helper_functions import get_ddo_samples
+
+
+@pytest.mark.parametrize('file_name', ['ddos.ndjson', 'ddos.ndjson.gz', 'ddos.ndjson.zst'])
+def test_ndjson_round_trip(tmp_path, file_name):
+    if file_name.endswith('.zst'):
+        pytest.importorskip('zstandard')
+    path = tmp_path / file_name
+    ddos = get_ddo_samples(10)
+    assert write_ddos(path, iter(ddos), chunk_size=3) == 10
+
+    read = list(read_ddos(path, chunk_size=4))
+    assert [ddo.as_dictionary() for ddo in read] == [ddo.as_dictionary() for ddo in ddos]
+
+
+def test_ndjson_workers(tmp_path):
+    path = tmp_path / 'ddos.ndjson.gz'
+    ddos = get_ddo_samples(20)
+    with NDJSONWriter(path, workers=2, chunk_size=3, max_pending=1) as writer:
+        writer.write_many(ddos[:10])
+        writer.write_many(ddo.as_dictionary() for ddo in ddos[10:])
+    assert writer.count == 20
+
+    dids = [ddo_dict['id'] for ddo_dict in read_ddo_dicts(path, workers=2, chunk_size=3)]
+    assert dids == [ddo.did for ddo in ddos]
+
+
+def test_ndjson_invalid_line(tmp_path):
+    path = tmp_path / 'ddos.ndjson'
+    write_ddos(path, get_ddo_samples(2))
+    with open(path, 'a') as f:
+        f.write('\n{"id": \n')
+
+    with pytest.raises(ValueError, match='line 4'):
+        list(read_ddo_dicts(path))
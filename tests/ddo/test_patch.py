@@ -0,0 +1,59 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from ocean_utils.ddo.patch import apply_patch, guard_patch, make_patch
+from tests.resources.helper_functions import get_ddo_sample
+
+
+def test_make_and_apply_patch():
+    source = {'a': {'b': 1, 'c': [1, 2, 3]}, 'd/e': 'x', 'f': True}
+    target = {'a': {'b': 2, 'c': [1, 5], 'g': {'h': None}}, 'd/e': 'x', 'f': 1}
+    patch = make_patch(source, target)
+    assert apply_patch(source, patch) == target
+    assert source['a']['b'] == 1, 'the document must not be changed.'
+    assert {'op': 'replace', 'path': '/a/b', 'value': 2} in patch
+    assert {'op': 'replace', 'path': '/f', 'value': 1} in patch
+    assert make_patch(target, target) == []
+    assert apply_patch(target, make_patch(target, source)) == source
+    assert apply_patch(source, [{'op': 'add', 'path': '/a/c/1', 'value': 9}])['a']['c'] == \
+        [1, 9, 2, 3]
+
+    with pytest.raises(ValueError):
+        apply_patch(source, [{'op': 'remove', 'path': '/missing'}])
+    with pytest.raises(ValueError):
+        apply_patch(source, [{'op': 'test', 'path': '/d~1e', 'value': 'y'}])
+    with pytest.raises(ValueError):
+        apply_patch(source, [{'op': 'move', 'path': '/a', 'from': '/f'}])
+
+
+def test_ddo_diff():
+    ddo = get_ddo_sample()
+    changed = get_ddo_sample()
+    changed.metadata['curation']['rating'] = 0.8
+    patch = ddo.diff(changed)
+    assert patch == [
+        {'op': 'replace', 'path': '/service/0/attributes/curation/rating', 'value': 0.8}
+    ]
+
+    patched = ddo.apply_patch(patch)
+    assert patched.as_dictionary() == changed.as_dictionary()
+    assert ddo.metadata['curation']['rating'] != 0.8
+    assert patched.diff(changed) == []
+
+
+def test_guard_patch():
+    source = get_ddo_sample().as_dictionary()
+    target = get_ddo_sample().as_dictionary()
+    target['service'][1]['serviceEndpoint'] = 'http://localhost:9000'
+    patch = guard_patch(source, make_patch(source, target))
+    assert [op['path'] for op in patch if op['op'] == 'test'] == \
+        ['/id', '/service/1/type', '/service/1/index']
+    assert apply_patch(source, patch) == target
+
+    # the services were reordered on the server since the patch was computed
+    diverged = get_ddo_sample().as_dictionary()
+    diverged['service'].reverse()
+    with pytest.raises(ValueError):
+        apply_patch(diverged, patch)
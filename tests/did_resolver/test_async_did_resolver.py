@@ -0,0 +1,86 @@
+#  Copyright 2018 Ocean Protocol Foundation
+#  SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+
+import pytest
+
+from ocean_utils.ddo.ddo import DDO
+from ocean_utils.did import DID, did_to_id_bytes
+from ocean_utils.did_resolver.async_did_resolver import AsyncDIDResolver
+
+
+class _AsyncRegistry:
+    def __init__(self, urls, delay=0.0):
+        self.urls = urls
+        self.delay = delay
+        self.calls = 0
+
+    async def get_registered_attribute(self, did_bytes):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        url = self.urls.get(did_bytes)
+        return {'value': url} if url else None
+
+
+class _AsyncAquarius:
+    def __init__(self, url):
+        self.url = url
+        self.requests = []
+        self.closed = False
+
+    async def get_asset_ddo(self, did):
+        self.requests.append(did)
+        return DDO(did)
+
+    async def close(self):
+        self.closed = True
+
+
+def _run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_async_resolve():
+    did = DID.did({"0": "0x1"})
+    registry = _AsyncRegistry({did_to_id_bytes(did): 'http://localhost:5000'}, delay=0.05)
+    resolver = AsyncDIDResolver(registry, aquarius_factory=_AsyncAquarius)
+
+    async def _resolve_all():
+        ddos = await asyncio.gather(*[resolver.resolve(did) for _ in range(10)])
+        clients = list(resolver._aquarius_clients.values())
+        await resolver.close()
+        return ddos, clients
+
+    ddos, clients = _run(_resolve_all())
+    assert all(ddo is ddos[0] and ddo.did == did for ddo in ddos)
+    assert registry.calls == 1
+    assert len(clients) == 1 and clients[0].requests == [did] and clients[0].closed
+
+    assert _run(resolver.get_resolve_url(b'unknown')) is None
+
+
+def test_async_resolve_timeout_and_cancel():
+    did = DID.did({"0": "0x2"})
+    registry = _AsyncRegistry({did_to_id_bytes(did): 'http://localhost:5000'}, delay=0.2)
+    resolver = AsyncDIDResolver(registry, aquarius_factory=_AsyncAquarius, timeout=0.01)
+
+    async def _resolve():
+        with pytest.raises(asyncio.TimeoutError):
+            await resolver.resolve(did)
+
+        task = asyncio.ensure_future(resolver.resolve(did, timeout=5))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # the shared lookup started by the first call is still running
+        return await resolver.resolve(did, timeout=5)
+
+    assert _run(_resolve()).did == did
+    assert registry.calls == 1
@@ -3,6 +3,8 @@
 
 import logging
 import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 from ocean_keeper import Keeper
@@ -11,11 +13,16 @@ from ocean_keeper.exceptions import (
 )
 from web3 import Web3
 
+from ocean_utils.aquarius.aquarius import Aquarius
+from ocean_utils.aquarius.aquarius_provider import AquariusProvider
+from ocean_utils.aquarius.known_dids import KnownDIDs
 from ocean_utils.ddo.ddo import DDO
-from ocean_utils.did import DID, did_to_id
+from ocean_utils.ddo.frozen import FrozenDDO
+from ocean_utils.did import DID, did_to_id, did_to_id_bytes
 from ocean_utils.did_resolver.did_resolver import (
     DIDResolver,
 )
+from ocean_utils.utils.refresh_ahead_cache import RefreshAheadCache
 from tests.resources.helper_functions import get_resource_path
 from tests.resources.tiers import e2e_test
 
@@ -145,3 +152,107 @@ def test_get_did_not_valid():
     did_resolver = DIDResolver(keeper().did_registry)
     with pytest.raises(TypeError):
         did_resolver.get_resolve_url('not valid')
+
+
+class _Registry:
+    def __init__(self, urls):
+        self.urls = urls
+        self.calls = 0
+
+    def get_registered_attribute(self, did_bytes):
+        self.calls += 1
+        time.sleep(0.05)
+        url = self.urls.get(did_bytes)
+        return {'value': url} if url else None
+
+
+class _Aquarius:
+    requests = []
+
+    def __init__(self, url):
+        assert url, f'Invalid url "{url}"'
+        self.url = url
+
+    def get_asset_ddo(self, did):
+        _Aquarius.requests.append((self.url, did))
+        return DDO(did)
+
+
+@pytest.fixture
+def fake_aquarius():
+    _Aquarius.requests = []
+    AquariusProvider.set_aquarius_class(_Aquarius)
+    yield _Aquarius
+    AquariusProvider.set_aquarius_class(Aquarius)
+
+
+def test_resolve_coalesces_concurrent_calls(fake_aquarius):
+    did = DID.did({"0": "0x1"})
+    registry = _Registry({did_to_id_bytes(did): 'http://localhost:5000'})
+    did_resolver = DIDResolver(registry)
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        ddos = list(executor.map(did_resolver.resolve, [did] * 10))
+
+    assert registry.calls == 1
+    assert fake_aquarius.requests == [('http://localhost:5000', did)]
+    assert all(ddo is ddos[0] and ddo.did == did for ddo in ddos)
+
+
+def test_resolve_many(fake_aquarius):
+    dids = [DID.did({"0": f"0x{i}"}) for i in range(6)]
+    registry = _Registry({
+        did_to_id_bytes(did): f'http://localhost:500{i % 2}' for i, did in enumerate(dids[:5])
+    })
+    did_resolver = DIDResolver(registry)
+    results = did_resolver.resolve_many(dids + [dids[0], 'not a did'])
+
+    assert [r.did for r in results] == dids + [dids[0], 'not a did']
+    for result in results[:5]:
+        assert result.error is None and result.ddo.did == result.did
+    assert results[6].ddo is results[0].ddo
+    # no url registered for the last valid did
+    assert results[5].ddo is None and isinstance(results[5].error, OceanDIDNotFound)
+    assert results[7].ddo is None and isinstance(results[7].error, ValueError)
+
+    assert len(fake_aquarius.requests) == 5
+    assert {url for url, _ in fake_aquarius.requests} == {
+        'http://localhost:5000', 'http://localhost:5001'}
+
+
+def test_resolve_with_ddo_cache(fake_aquarius):
+    did = DID.did({"0": "0x1"})
+    registry = _Registry({did_to_id_bytes(did): 'http://localhost:5000'})
+    ddo_cache = RefreshAheadCache(ttl=60)
+    did_resolver = DIDResolver(registry, ddo_cache=ddo_cache)
+    ddo = did_resolver.resolve(did)
+    assert isinstance(ddo, FrozenDDO) and ddo.did == did
+    ddo.thaw().add_service('Metadata', 'http://localhost:5000', values={'main': {}})
+    cached = did_resolver.resolve(did)
+    assert cached is ddo, 'cache hits should serve the cached snapshot.'
+    assert not cached.services, 'a cached DDO must not be changed through thawed copies.'
+    assert registry.calls == 1 and len(fake_aquarius.requests) == 1
+
+    other_did = DID.did({"0": "0x2"})
+    registry.urls[did_to_id_bytes(other_did)] = 'http://localhost:5000'
+    results = did_resolver.resolve_many([did, other_did])
+    assert [r.ddo.did for r in results] == [did, other_did]
+    assert all(isinstance(r.ddo, FrozenDDO) for r in results)
+    assert registry.calls == 2 and len(fake_aquarius.requests) == 2, \
+        'only the DIDs missing from the cache should be looked up.'
+    assert did_resolver.resolve(other_did).did == other_did
+    assert registry.calls == 2
+    ddo_cache.close()
+
+
+def test_resolve_unknown_did(fake_aquarius):
+    did = DID.did({"0": "0x1"})
+    registry = _Registry({did_to_id_bytes(did): 'http://localhost:5000'})
+    did_resolver = DIDResolver(registry, known_dids=KnownDIDs())
+    with pytest.raises(OceanDIDNotFound):
+        did_resolver.resolve(did)
+    assert registry.calls == 0 and not fake_aquarius.requests
+    [result] = did_resolver.resolve_many([did])
+    assert result.ddo is None and isinstance(result.error, OceanDIDNotFound)
+    assert registry.calls == 0 and not fake_aquarius.requests
+    with pytest.raises(ValueError):
+        did_resolver.resolve(did_to_id(did))
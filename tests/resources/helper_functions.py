@@ -8,6 +8,7 @@ import pathlib
 from ocean_keeper.utils import get_account
 
 from ocean_utils.ddo.ddo import DDO
+from ocean_utils.did import DID
 
 PUBLISHER_INDEX = 1
 CONSUMER_INDEX = 0
@@ -33,6 +34,25 @@ def get_ddo_sample():
     return DDO(json_filename=get_resource_path('ddo', 'ddo_sa_sample.json'))
 
 
+def get_ddo_sample_dicts(count, start=0, file_name='ddo_sa_sample.json'):
+    """Return `count` copies of a sample DDO dict, each with its own DID."""
+    with open(get_resource_path('ddo', file_name)) as f:
+        json_text = f.read()
+
+    ddo_dicts = []
+    for i in range(start, start + count):
+        ddo_dict = json.loads(json_text)
+        ddo_dict['id'] = DID.did({"0": f"0x{i}"})
+        ddo_dicts.append(ddo_dict)
+    return ddo_dicts
+
+
+def get_ddo_samples(count, start=0, file_name='ddo_sa_sample.json'):
+    """Return `count` sample DDOs, each with its own DID."""
+    return [DDO(dictionary=ddo_dict)
+            for ddo_dict in get_ddo_sample_dicts(count, start, file_name)]
+
+
 def log_event(event_name):
     def _process_event(event):
         print(f'Received event {event_name}: {event}')
@@ -9,8 +9,9 @@ import secrets
 import pytest
 from web3 import Web3
 
-from ocean_utils.did import (DID, did_parse, did_to_id, did_to_id_bytes, id_to_did, is_did_valid,
-                             OCEAN_PREFIX)
+from ocean_utils.did import (DID, did_parse, did_to_id, did_to_id_bytes, dids_to_id_bytes,
+                             dids_to_ids, id_to_did, ids_to_dids, is_did_valid, OCEAN_PREFIX,
+                             ParsedDID)
 from tests.resources.tiers import e2e_test
 
 TEST_SERVICE_TYPE = 'ocean-meta-storage'
@@ -49,6 +50,30 @@ def test_did_parse():
         assert is_did_valid(valid_did.encode())
 
 
+def test_parsed_did():
+    test_id = secrets.token_hex(32)
+    did = f'{OCEAN_PREFIX}{test_id}'
+
+    parsed = ParsedDID.from_did(did)
+    assert parsed.did == did
+    assert parsed.method == 'op'
+    assert parsed.id == test_id
+    assert parsed.id_bytes == Web3.toBytes(hexstr=test_id)
+    assert parsed.asset_id == f'0x{test_id}'
+    assert ParsedDID.from_did(did) is parsed, 'parse results should be memoized.'
+
+    with pytest.raises(AttributeError):
+        parsed.id = '0'
+
+    assert ParsedDID.from_did('did:opx:Somebadtexstwithnohexvalue').id_bytes is None
+
+    with pytest.raises(ValueError):
+        ParsedDID.from_did('op:{}'.format(test_id))
+
+    with pytest.raises(TypeError):
+        ParsedDID.from_did(did.encode())
+
+
 def test_id_to_did():
     test_id = '%s' % secrets.token_hex(32)
     valid_did_text = 'did:op:{}'.format(test_id)
@@ -114,6 +139,40 @@ def test_did_to_bytes():
         did_to_id_bytes(42)
 
 
+def test_bulk_did_conversion():
+    numpy = pytest.importorskip('numpy')
+    ids = [secrets.token_hex(32) for _ in range(10)]
+    mixed_ids = ids[:4] + [f'0x{_id}' for _id in ids[4:7]] + [bytes.fromhex(_id) for _id in ids[7:]]
+    dids = ids_to_dids(mixed_ids)
+    assert dids == [id_to_did(_id) for _id in mixed_ids]
+    assert ids_to_dids(['', b'']) == [id_to_did(''), id_to_did(b'')]
+
+    assert dids_to_ids(dids) == ids
+    id_bytes = dids_to_id_bytes(dids)
+    assert id_bytes == [did_to_id_bytes(did) for did in dids]
+    assert dids_to_id_bytes(['did:op:0x12']) == [did_to_id_bytes('did:op:0x12')] == [b'\x12']
+
+    id_array = dids_to_id_bytes(dids, as_array=True)
+    assert id_array.shape == (10, 32) and id_array.dtype == numpy.uint8
+    assert ids_to_dids(id_array) == dids
+    assert dids_to_id_bytes(['did:op:0a'], as_array=True)[0].tobytes() == b'\0' * 31 + b'\x0a'
+
+    with pytest.raises(ValueError):
+        ids_to_dids(['0xnothex'])
+
+    with pytest.raises(TypeError):
+        ids_to_dids([None])
+
+    with pytest.raises(ValueError):
+        dids_to_ids(dids + [ids[0]])
+
+    with pytest.raises(ValueError):
+        dids_to_id_bytes(['did:opx:Somebadtexstwithnohexvalue0x123456789abcdecfg'])
+
+    with pytest.raises(ValueError):
+        dids_to_id_bytes([f'did:op:{secrets.token_hex(33)}'], as_array=True)
+
+
 def test_create_did():
     proof = {
         "type": "DDOIntegritySignature",
@@ -127,3 +186,9 @@ def test_create_did():
     }
     did = DID.did(proof['checksum'])
     assert did == 'did:op:138fccf336883ae6312c9b8b375745a90be369454080e90985fb3e314ab0df25'
+
+
+def test_did_many():
+    seeds = [{"0": f"0x{i}", "1": f"0x{i + 1}"} for i in range(10)]
+    assert DID.did_many(seeds) == [DID.did(seed) for seed in seeds]
+    assert DID.did_many([]) == []
@@ -1,9 +1,21 @@
 #  Copyright 2018 Ocean Protocol Foundation
 #  SPDX-License-Identifier: Apache-2.0
 
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 from web3 import Web3
 
+from ocean_utils.agreements.service_agreement import ServiceAgreement
 from ocean_utils.utils import utilities
+from ocean_utils.utils.bloom_filter import CountingBloomFilter
+from ocean_utils.utils.refresh_ahead_cache import RefreshAheadCache
+from ocean_utils.utils.single_flight import AsyncSingleFlight, SingleFlight
 from tests.resources.tiers import e2e_test
 
 
@@ -13,3 +25,201 @@ def test_convert():
     text_bytes = utilities.convert_to_bytes(Web3, input_text)
     print("output %s" % utilities.convert_to_string(Web3, text_bytes))
     assert input_text == utilities.convert_to_text(Web3, text_bytes)
+
+
+def test_single_flight():
+    single_flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def _fetch(key):
+        calls.append(key)
+        release.wait(5)
+        return {'key': key}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(single_flight.do, 'did:op:1', _fetch, 'did:op:1')
+                   for _ in range(8)]
+        time.sleep(0.1)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert calls == ['did:op:1']
+    assert all(r is results[0] for r in results)
+
+    def _fail():
+        raise ValueError('not found')
+
+    with pytest.raises(ValueError):
+        single_flight.do('did:op:2', _fail)
+    # completed calls are not cached
+    assert single_flight.do('did:op:1', _fetch, 'did:op:1') == {'key': 'did:op:1'}
+    assert len(calls) == 2
+
+
+def test_async_single_flight():
+    single_flight = AsyncSingleFlight()
+    calls = []
+
+    async def _fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        return key
+
+    async def _run():
+        waiters = [asyncio.ensure_future(single_flight.do('a', _fetch, 'a')) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        # a cancelled waiter does not cancel the shared call
+        waiters[0].cancel()
+        return await asyncio.gather(*waiters[1:])
+
+    loop = asyncio.new_event_loop()
+    assert loop.run_until_complete(_run()) == ['a'] * 4
+    loop.close()
+    assert calls == ['a']
+
+
+def test_refresh_ahead_cache():
+    now = [0.0]
+    loads = []
+
+    def _load(key):
+        loads.append(key)
+        return f'{key}-{len(loads)}'
+
+    cache = RefreshAheadCache(ttl=10, refresh_ahead=0.5, max_stale=5, max_size=2,
+                              clock=lambda: now[0])
+    assert cache.get('a', _load, 'a') == 'a-1'
+    now[0] = 4
+    assert cache.get('a', _load, 'a') == 'a-1'
+    assert loads == ['a']
+
+    # past the refresh point the cached value is served and refreshed in the background
+    now[0] = 6
+    assert cache.get('a', _load, 'a') == 'a-1'
+    cache.close()
+    assert loads == ['a', 'a']
+    assert cache.get('a', _load, 'a') == 'a-2'
+    # once closed, entries past the refresh point are served without a refresh
+    now[0] = 12
+    assert cache.get('a', _load, 'a') == 'a-2'
+    assert loads == ['a', 'a']
+
+    # expired past max_stale, loaded synchronously
+    now[0] = 30
+    cache = RefreshAheadCache(ttl=10, refresh_ahead=0.5, max_stale=5, max_size=2,
+                              clock=lambda: now[0])
+    cache.get('a', _load, 'a')
+    now[0] = 46
+    assert cache.get('a', _load, 'a') == 'a-4'
+
+    cache.get('b', _load, 'b')
+    cache.get('c', _load, 'c')
+    assert len(cache) == 2, 'least recently used entry should be evicted.'
+    cache.invalidate('c')
+    assert len(cache) == 1
+    cache.close()
+
+
+def test_refresh_ahead_cache_invalidate_during_refresh():
+    now = [0.0]
+    values = {'a': 'old'}
+    started = threading.Event()
+    release = threading.Event()
+
+    def _load(key):
+        value = values[key]
+        if now[0]:
+            started.set()
+            release.wait(5)
+        return value
+
+    cache = RefreshAheadCache(ttl=10, refresh_ahead=0.5, clock=lambda: now[0])
+    assert cache.get('a', _load, 'a') == 'old'
+    # a background refresh reads the old value, then the key is updated and invalidated.
+    now[0] = 6
+    assert cache.get('a', _load, 'a') == 'old'
+    assert started.wait(5)
+    values['a'] = 'new'
+    cache.invalidate('a')
+    release.set()
+    cache.close()
+    assert cache.get('a', _load, 'a') == 'new', 'a load started before invalidate was stored.'
+
+    generation = cache.generation('b')
+    cache.clear()
+    assert not cache.put('b', 'old', generation)
+    assert cache.lookup('b', _load, 'b') == (False, None)
+    assert cache.put('b', 'new', cache.generation('b'))
+    assert cache.lookup('b', _load, 'b') == (True, 'new')
+
+
+def test_counting_bloom_filter():
+    bloom_filter = CountingBloomFilter(1000, error_rate=0.01)
+    # fixed keys, random ones would make the discard check below fail now and then when
+    # the discarded key is a false positive of the remaining ones.
+    keys = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(1000)]
+    for key in keys:
+        bloom_filter.add(key)
+
+    assert len(bloom_filter) == 1000
+    assert all(key in bloom_filter for key in keys)
+    false_positives = sum(
+        hashlib.sha256(f'unknown-{i}'.encode()).hexdigest() in bloom_filter for i in range(10000)
+    )
+    assert false_positives < 300
+
+    bloom_filter.discard(keys[0])
+    assert keys[0] not in bloom_filter
+    assert all(key in bloom_filter for key in keys[1:])
+    bloom_filter.clear()
+    assert keys[1] not in bloom_filter and len(bloom_filter) == 0
+
+
+def _original_checksum(seed):
+    return hashlib.sha3_256(
+        (json.dumps(dict(sorted(seed.items(), reverse=False))).replace(" ", "")).encode(
+            'utf-8')).hexdigest()
+
+
+def test_checksum():
+    seeds = [
+        {},
+        {'0': '0x52b5c93b82dd9e7ecc3d9fdf4755f7f69a54484941897dc517b4adfe3bbc3377'},
+        {'name': 'UK Weather information 2011', 'files': [{'url': 'a b', 'index': 0}],
+         'price': '10', 'author': 'Met Office', 'dateCreated': '2012-10-10T17:00:00Z'},
+        {'b': {'z': 1, 'a': [1.5, None, True]}, 'a': 'caf\u00e9 \u2603'},
+        {2: 'int keys', 1: {'c': 'd e'}},
+    ]
+    for seed in seeds:
+        assert utilities.checksum(seed) == _original_checksum(seed)
+        assert utilities.checksum(seed, legacy=True) == _original_checksum(seed)
+    assert utilities.checksum_many(seeds) == [_original_checksum(seed) for seed in seeds]
+
+    # canonical mode keeps the spaces in values and sorts the keys at all levels
+    assert utilities.checksum({'a': 'x y'}, legacy=False) != \
+        utilities.checksum({'a': 'xy'}, legacy=False)
+    assert utilities.checksum({'a': {'b': 1, 'c': 2}, 'd': 3}, legacy=False) == \
+        utilities.checksum({'d': 3, 'a': {'c': 2, 'b': 1}}, legacy=False)
+    assert utilities.checksum({'a': 'x y', 1: [1, 2]}, legacy=False) == hashlib.sha3_256(
+        json.dumps({'a': 'x y', '1': [1, 2]}, sort_keys=True, separators=(',', ':')).encode()
+    ).hexdigest()
+
+
+def test_generate_ids():
+    new_id = utilities.generate_new_id()
+    assert len(new_id) == 64 and int(new_id, 16) >= 0
+    assert utilities.generate_prefixed_id().startswith('0x')
+
+    ids = utilities.generate_new_ids(1000)
+    assert len(ids) == 1000 and len(set(ids)) == 1000
+    assert all(len(_id) == 64 and int(_id, 16) >= 0 for _id in ids)
+    prefixed_ids = utilities.generate_prefixed_ids(3)
+    assert all(_id.startswith('0x') and len(_id) == 66 for _id in prefixed_ids)
+    assert utilities.generate_new_ids(0) == []
+
+    agreement_ids = ServiceAgreement.create_new_agreement_ids(5)
+    assert len(set(agreement_ids)) == 5 and all(_id.startswith('0x') for _id in agreement_ids)
+
+    packed = utilities.generate_id_bytes(10)
+    assert isinstance(packed, bytes) and len(packed) == 320